@@ -1,12 +1,15 @@
 # src/mongo_connection/__init__.py (UPDATE - it's empty!)
 
 from .core.connection import Connection, connect
+from .core.async_connection import AsyncConnection, aconnect
 from .core.exceptions import InterfaceError
 from .app import MongoApp, create_app
 
 __all__ = [
     'Connection',
     'connect',
+    'AsyncConnection',
+    'aconnect',
     'InterfaceError',
     'MongoApp',
     'create_app',
@@ -0,0 +1,91 @@
+"""Bulk Write Helper for MongoDB"""
+
+from typing import Any
+
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
+
+from ..core.connection import Connection
+from ..core.exceptions import ProgrammingError
+
+
+class BulkBuilder:
+    """Accumulate mixed write operations and ship them in one round trip.
+
+    A sequence of individual insert_one/update_one/delete_one calls pays
+    one network round trip each; bulk_write sends the whole batch as a
+    single command. Builder methods return self so operations chain:
+
+        BulkBuilder(conn, "users") \\
+            .insert({"name": "a"}) \\
+            .update_one({"name": "b"}, {"$set": {"age": 2}}) \\
+            .delete_one({"name": "c"}) \\
+            .execute()
+    """
+
+    def __init__(self, connection: Connection, collection: str):
+        self._conn = connection
+        self._collection_name = collection
+        self._ops: list = []
+
+    def insert(self, document: dict) -> 'BulkBuilder':
+        """Queue an insert"""
+        self._ops.append(InsertOne(document))
+        return self
+
+    def update_one(self, filter: dict, update: dict, upsert: bool = False) -> 'BulkBuilder':
+        """Queue an update of the first matching document"""
+        self._ops.append(UpdateOne(filter, update, upsert=upsert))
+        return self
+
+    def update_many(self, filter: dict, update: dict, upsert: bool = False) -> 'BulkBuilder':
+        """Queue an update of all matching documents"""
+        self._ops.append(UpdateMany(filter, update, upsert=upsert))
+        return self
+
+    def replace_one(self, filter: dict, replacement: dict, upsert: bool = False) -> 'BulkBuilder':
+        """Queue a replacement of the first matching document"""
+        self._ops.append(ReplaceOne(filter, replacement, upsert=upsert))
+        return self
+
+    def delete_one(self, filter: dict) -> 'BulkBuilder':
+        """Queue a delete of the first matching document"""
+        self._ops.append(DeleteOne(filter))
+        return self
+
+    def delete_many(self, filter: dict) -> 'BulkBuilder':
+        """Queue a delete of all matching documents"""
+        self._ops.append(DeleteMany(filter))
+        return self
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def execute(self, ordered: bool = True, **kwargs) -> Any:
+        """Send the queued operations with one bulk_write command.
+
+        Returns the driver's BulkWriteResult; the queue is cleared so
+        the builder can be reused. ordered=False lets the server apply
+        operations in parallel when ordering doesn't matter.
+        """
+        if not self._ops:
+            raise ProgrammingError("No operations queued for bulk write")
+        try:
+            coll = self._conn.collection(self._collection_name)
+            if "session" not in kwargs:
+                session = self._conn._active_session
+                if session is not None:
+                    kwargs["session"] = session
+            result = coll.bulk_write(self._ops, ordered=ordered, **kwargs)
+            self._ops = []
+            return result
+        except ProgrammingError:
+            raise
+        except Exception as e:
+            raise ProgrammingError(f"Bulk write failed: {e}")
@@ -1,16 +1,30 @@
 """Connection Pool for MongoDB"""
 
+import os
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from queue import Queue, Empty
 
 from ..core.connection import Connection
 from ..core.constants import (
-    DEFAULT_MIN_CONNECTIONS, DEFAULT_MAX_CONNECTIONS, DEFAULT_CONNECTION_TIMEOUT
+    DEFAULT_MIN_CONNECTIONS, DEFAULT_MAX_CONNECTIONS, DEFAULT_CONNECTION_TIMEOUT,
+    DEFAULT_VALIDATION_INTERVAL
 )
 from ..core.exceptions import InterfaceError, OperationalError
 
 
+class _Shard:
+    """One stripe of the idle pool with its own lock"""
+
+    __slots__ = ("cv", "pool")
+
+    def __init__(self):
+        self.cv = threading.Condition()
+        self.pool: deque[Connection] = deque()
+
+
 class ConnectionPool:
     """Thread-safe connection pool for MongoDB"""
 
@@ -25,11 +39,12 @@ class ConnectionPool:
             minconn: int = DEFAULT_MIN_CONNECTIONS,
             maxconn: int = DEFAULT_MAX_CONNECTIONS,
             connect_timeout: float = DEFAULT_CONNECTION_TIMEOUT,
+            validation_interval: float = DEFAULT_VALIDATION_INTERVAL,
             **kwargs
     ):
         """
         Create a connection pool.
-        
+
         Args:
             dsn: Connection string
             host: Database host
@@ -40,6 +55,8 @@ class ConnectionPool:
             minconn: Minimum number of connections
             maxconn: Maximum number of connections
             connect_timeout: Connection timeout
+            validation_interval: Seconds a connection may sit idle before
+                it is pinged on checkout
             **kwargs: Additional connection parameters
         """
         self._dsn = dsn
@@ -51,26 +68,40 @@ class ConnectionPool:
         self._minconn = minconn
         self._maxconn = maxconn
         self._connect_timeout = connect_timeout
+        self._validation_interval_ns = int(validation_interval * 1e9)
         self._kwargs = kwargs
 
-        self._pool: Queue[Connection] = Queue(maxsize=maxconn)
-        self._created_connections = 0
-        self._lock = threading.Lock()
+        # Idle connections are striped across per-CPU shards, each a LIFO
+        # stack with its own lock: threads route to a shard by ident, so
+        # contention scales with threads-per-shard instead of all threads
+        # fighting over one mutex. An empty shard steals from neighbours.
+        shard_count = max(1, min(os.cpu_count() or 1, maxconn))
+        self._shards = tuple(_Shard() for _ in range(shard_count))
+        self._slots = threading.BoundedSemaphore(maxconn)
         self._closed = False
 
-        # Create initial connections
-        for _ in range(minconn):
-            self._create_connection()
+        # Create initial connections concurrently: each connect blocks on
+        # TCP + auth, so a serial warmup would cost minconn round-trips
+        if minconn > 0:
+            with ThreadPoolExecutor(max_workers=minconn) as executor:
+                futures = [
+                    executor.submit(self._create_connection)
+                    for _ in range(minconn)
+                ]
+                for i, future in enumerate(futures):
+                    self._shards[i % shard_count].pool.append(future.result())
 
     def _create_connection(self) -> Connection:
         """Create a new connection"""
-        with self._lock:
-            if self._closed:
-                raise InterfaceError("Pool is closed")
+        if self._closed:
+            raise InterfaceError("Pool is closed")
 
-            if self._created_connections >= self._maxconn:
-                raise OperationalError("Maximum number of connections reached")
+        # Admission control without a lock: connecting happens outside
+        # any critical section so checkouts don't serialize on it
+        if not self._slots.acquire(blocking=False):
+            raise OperationalError("Maximum number of connections reached")
 
+        try:
             conn = Connection(
                 dsn=self._dsn,
                 host=self._host,
@@ -82,8 +113,10 @@ class ConnectionPool:
                 **self._kwargs
             )
             conn.connect()
-            self._created_connections += 1
-            return conn
+        except Exception:
+            self._slots.release()
+            raise
+        return conn
 
     def getconn(self, timeout: float | None = None) -> Connection:
         """Get a connection from the pool"""
@@ -93,31 +126,67 @@ class ConnectionPool:
         if timeout is None:
             timeout = self._connect_timeout
 
+        # Try to pop an idle connection (most recently used first)
+        conn = self._try_pop()
+        if conn is not None:
+            return self._validate_connection(conn)
+
+        # Pool is empty, try to create a new connection
         try:
-            # Try to get existing connection
-            conn = self._pool.get(timeout=timeout)
+            return self._create_connection()
+        except OperationalError:
+            # Max connections reached, wait for one to become available.
+            # Returns land on the returning thread's shard, so wait in
+            # short slices and re-steal rather than blocking on one shard.
+            deadline = time.monotonic() + timeout
+            shard = self._home_shard()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise OperationalError("Timed out waiting for a connection")
+                with shard.cv:
+                    shard.cv.wait(min(remaining, 0.05))
+                conn = self._try_pop()
+                if conn is not None:
+                    return self._validate_connection(conn)
+
+    def _home_shard(self) -> _Shard:
+        """Get the shard the calling thread routes to"""
+        return self._shards[threading.get_ident() % len(self._shards)]
 
-            # Check if connection is still alive
-            try:
-                # Ping the database to check connection
-                conn.client.admin.command('ping')
-            except Exception:
-                # Connection is dead, create a new one
-                conn = self._create_connection()
+    def _try_pop(self) -> Connection | None:
+        """Pop an idle connection from the home shard, stealing from
+        neighbours when it is empty"""
+        home = self._home_shard()
+        with home.cv:
+            if home.pool:
+                return home.pool.pop()
+        for shard in self._shards:
+            if shard is home:
+                continue
+            with shard.cv:
+                if shard.pool:
+                    return shard.pool.pop()
+        return None
 
+    def _validate_connection(self, conn: Connection) -> Connection:
+        """Check a pooled connection, pinging only if it sat idle too long"""
+        last_used = getattr(conn, '_last_used_ns', None)
+        if (last_used is not None
+                and time.monotonic_ns() - last_used < self._validation_interval_ns):
+            # Recently used: skip the ping and let the next operation
+            # surface a dead connection
             return conn
-        except Empty:
-            # Pool is empty, try to create a new connection
-            try:
-                return self._create_connection()
-            except OperationalError:
-                # Max connections reached, wait for one to become available
-                conn = self._pool.get(timeout=timeout)
-                try:
-                    conn.client.admin.command('ping')
-                except Exception:
-                    conn = self._create_connection()
-                return conn
+
+        try:
+            # Ping the database to check connection
+            conn.client.admin.command('ping')
+        except Exception:
+            # Connection is dead, create a new one
+            conn.close()
+            self._slots.release()
+            conn = self._create_connection()
+        return conn
 
     def putconn(self, conn: Connection) -> None:
         """Return a connection to the pool"""
@@ -126,31 +195,27 @@ class ConnectionPool:
             return
 
         if conn.closed:
-            with self._lock:
-                self._created_connections -= 1
+            self._slots.release()
             return
 
-        try:
-            self._pool.put_nowait(conn)
-        except:
-            # Pool is full, close the connection
-            conn.close()
-            with self._lock:
-                self._created_connections -= 1
+        conn._last_used_ns = time.monotonic_ns()
+        # Total live connections are capped by the admission semaphore,
+        # so the shard can take the return unconditionally
+        shard = self._home_shard()
+        with shard.cv:
+            shard.pool.append(conn)
+            shard.cv.notify()
 
     def closeall(self) -> None:
         """Close all connections in the pool"""
         self._closed = True
 
-        while not self._pool.empty():
-            try:
-                conn = self._pool.get_nowait()
-                conn.close()
-            except Empty:
-                break
-
-        with self._lock:
-            self._created_connections = 0
+        for shard in self._shards:
+            with shard.cv:
+                while shard.pool:
+                    shard.pool.pop().close()
+                    self._slots.release()
+                shard.cv.notify_all()
 
     @contextmanager
     def connection(self, timeout: float | None = None):
@@ -3,10 +3,21 @@
 import os
 from datetime import datetime
 
+try:
+    # C-implemented decoder, ~3-5x faster than stdlib json on migration files
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+from pymongo import InsertOne, UpdateMany, DeleteMany
+
 from .schema import Schema
 from ..core.connection import Connection
 from ..core.exceptions import ProgrammingError
 
+# Operation types that can be folded into a single bulk_write
+_WRITE_OPS = ("insert", "update", "delete")
+
 
 class Migration:
     """Database migration management for MongoDB"""
@@ -14,10 +25,14 @@ class Migration:
     def __init__(self, connection: Connection):
         self._conn = connection
         self._schema = Schema(connection)
+        self._applied: set[str] | None = None
         self._ensure_migrations_collection()
 
     def _ensure_migrations_collection(self) -> None:
         """Ensure migrations collection exists"""
+        if "schema_migrations" in self._conn._known_collections:
+            return
+
         if not self._schema.collection_exists("schema_migrations"):
             self._schema.create_collection(
                 "schema_migrations",
@@ -39,11 +54,29 @@ class Migration:
                 unique=True
             )
 
+        self._conn._known_collections.add("schema_migrations")
+
     def get_applied_migrations(self) -> set[str]:
-        """Get list of applied migrations"""
+        """Get list of applied migrations (cached after the first fetch)"""
+        if self._applied is None:
+            collection = self._conn.collection("schema_migrations")
+            # Excluding _id makes this a covered query: with the unique
+            # version index the server answers from the B-tree without
+            # fetching documents. No hint — the planner picks the index
+            # when it exists, and a pre-existing schema_migrations
+            # collection may not have it
+            cursor = collection.find({}, {"version": 1, "_id": 0})
+            self._applied = {doc["version"] for doc in cursor}
+        return self._applied
+
+    def _is_applied(self, version: str) -> bool:
+        """Check whether a migration was applied without fetching the full set"""
+        if self._applied is not None:
+            return version in self._applied
+        # Point lookup on the unique version index instead of streaming
+        # every migration record
         collection = self._conn.collection("schema_migrations")
-        cursor = collection.find({}, {"version": 1})
-        return {doc["version"] for doc in cursor}
+        return collection.count_documents({"version": version}, limit=1) > 0
 
     def apply_migration(self, version: str, operations: list[dict]) -> None:
         """
@@ -53,15 +86,46 @@ class Migration:
             version: Migration version identifier
             operations: List of MongoDB operations to execute
         """
-        applied = self.get_applied_migrations()
-
-        if version in applied:
+        if self._is_applied(version):
             return  # Already applied
 
+        # Consecutive write ops against one collection are folded into a
+        # single ordered bulk_write, so N write ops cost one round trip
+        # per same-collection run instead of one each
+        pending: list = []
+        pending_collection: str | None = None
+
+        def flush() -> None:
+            if pending:
+                self._conn.collection(pending_collection).bulk_write(
+                    pending, ordered=True
+                )
+                pending.clear()
+
         try:
             # Execute migration operations
             for op in operations:
                 op_type = op.get("type")
+                if op_type in _WRITE_OPS:
+                    if op.get("collection") != pending_collection:
+                        flush()
+                        pending_collection = op.get("collection")
+                    if op_type == "insert":
+                        pending.extend(
+                            InsertOne(doc) for doc in op.get("documents", [])
+                        )
+                    elif op_type == "update":
+                        pending.append(
+                            UpdateMany(op.get("filter", {}), op.get("update", {}))
+                        )
+                    else:
+                        pending.append(DeleteMany(op.get("filter", {})))
+                    continue
+
+                # Schema operations end the current run
+                flush()
+                pending_collection = None
+
                 if op_type == "create_collection":
                     self._schema.create_collection(**op.get("params", {}))
                 elif op_type == "drop_collection":
@@ -70,36 +134,27 @@ class Migration:
                     self._schema.create_index(**op.get("params", {}))
                 elif op_type == "drop_index":
                     self._schema.drop_index(op.get("collection"), op.get("index"))
-                elif op_type == "insert":
-                    collection = self._conn.collection(op.get("collection"))
-                    collection.insert_many(op.get("documents", []))
-                elif op_type == "update":
-                    collection = self._conn.collection(op.get("collection"))
-                    collection.update_many(
-                        op.get("filter", {}),
-                        op.get("update", {})
-                    )
-                elif op_type == "delete":
-                    collection = self._conn.collection(op.get("collection"))
-                    collection.delete_many(op.get("filter", {}))
                 else:
                     raise ProgrammingError(f"Unknown operation type: {op_type}")
 
+            flush()
+
             # Record migration
             collection = self._conn.collection("schema_migrations")
             collection.insert_one({
                 "version": version,
                 "applied_at": datetime.utcnow()
             })
+            if self._applied is not None:
+                self._applied.add(version)
         except Exception as e:
             raise ProgrammingError(f"Migration {version} failed: {e}")
 
     def apply_migration_file(self, filepath: str) -> None:
         """Apply a migration from a JSON file"""
-        import json
         version = os.path.basename(filepath)
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = _json.loads(f.read())
 
         version = data.get("version", version)
         operations = data.get("operations", [])
@@ -107,27 +162,27 @@ class Migration:
 
     def rollback_migration(self, version: str) -> None:
         """Rollback a migration (requires rollback operations)"""
-        applied = self.get_applied_migrations()
-
-        if version not in applied:
+        if not self._is_applied(version):
             raise ProgrammingError(f"Migration {version} not applied")
 
         # Note: Rollback requires separate rollback operation files
         # This is a simplified version that just removes the migration record
         collection = self._conn.collection("schema_migrations")
         collection.delete_one({"version": version})
+        if self._applied is not None:
+            self._applied.discard(version)
 
     def migrate_from_directory(self, directory: str) -> None:
         """Apply all migrations from a directory"""
-        applied = self.get_applied_migrations()
-
-        # Get all JSON files in directory
-        migration_files = [
-            f for f in os.listdir(directory)
-            if f.endswith('.json')
-        ]
-        migration_files.sort()  # Apply in order
+        # Warm the applied-set cache so per-file checks stay in memory
+        self.get_applied_migrations()
+
+        # scandir avoids a stat per entry compared to listdir
+        with os.scandir(directory) as entries:
+            migration_files = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith('.json')
+            )
 
-        for filename in migration_files:
-            filepath = os.path.join(directory, filename)
+        for filepath in migration_files:
             self.apply_migration_file(filepath)
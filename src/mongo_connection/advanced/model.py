@@ -1,18 +1,45 @@
 """ORM-like Model Base Class for MongoDB"""
 
-from typing import Any, Optional, ClassVar
+from functools import lru_cache
+from typing import Any, Iterable, Optional, ClassVar
+import bson
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+from pymongo import InsertOne, UpdateOne
 from ..core.connection import Connection
 from ..core.exceptions import ProgrammingError
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+@lru_cache(maxsize=4096)
+def _to_oid(value: str) -> ObjectId:
+    """Parse a 24-hex-char id string into an ObjectId (cached)"""
+    return ObjectId(value)
+
 
 class Model:
     """Base model class for simple ORM-like functionality with MongoDB"""
 
     _collection: ClassVar[str | None] = None
     _connection: ClassVar[Connection | None] = None
+    _field_names: ClassVar[tuple[str, ...] | None] = None
     _id: Optional[ObjectId] = None
 
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the public field names from class annotations.
+
+        Subclasses that annotate their fields get a fixed tuple, so save
+        and to_dict skip the per-attribute startswith scan; unannotated
+        subclasses keep the dynamic __dict__ walk.
+        """
+        super().__init_subclass__(**kwargs)
+        names: list[str] = list(cls._field_names or ())
+        for name in cls.__dict__.get('__annotations__', ()):
+            if not name.startswith('_') and name not in names:
+                names.append(name)
+        cls._field_names = tuple(names) or None
+
     @classmethod
     def set_connection(cls, connection: Connection) -> None:
         """Set the database connection for this model"""
@@ -25,50 +52,109 @@ class Model:
             return cls._collection
         return cls.__name__.lower()
 
-    def save(self, connection: Connection | None = None) -> None:
+    def save(self, connection: Connection | None = None, session=None) -> None:
         """Save the model instance"""
         conn = connection or self._connection
         if not conn:
             raise ProgrammingError("No connection available")
-        
+
         collection_name = self._get_collection_name()
         collection = conn.collection(collection_name)
-        
-        # Get fields and values (exclude _id and private attributes)
-        data = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_') or key == '_id':
-                data[key] = value
-        
+        session = session or conn._active_session
+
+        data = self.to_dict()
+
         if self._id:
             # Update existing document
             result = collection.update_one(
                 {"_id": self._id},
-                {"$set": data}
+                {"$set": data},
+                session=session
             )
             if result.matched_count == 0:
                 raise ProgrammingError("Document not found for update")
         else:
             # Insert new document
-            result = collection.insert_one(data)
+            result = collection.insert_one(data, session=session)
             self._id = result.inserted_id
 
-    def delete(self, connection: Connection | None = None) -> None:
+    @classmethod
+    def save_many(
+            cls,
+            instances: Iterable['Model'],
+            connection: Connection | None = None,
+            bypass_document_validation: bool = False,
+            session=None
+    ) -> None:
+        """Save many instances with a single bulk_write per collection.
+
+        Instances are grouped by collection; unsaved ones become InsertOne
+        requests (with a client-generated ObjectId, since bulk results do
+        not report inserted ids) and saved ones become UpdateOne requests.
+        One unordered bulk_write per collection replaces a round trip per
+        instance.
+        """
+        conn = connection or cls._connection
+        if not conn:
+            raise ProgrammingError("No connection available")
+
+        groups: dict[str, list[Model]] = {}
+        for instance in instances:
+            groups.setdefault(instance._get_collection_name(), []).append(instance)
+
+        for collection_name, group in groups.items():
+            # Same-shape batches (one annotated class) get their insert
+            # documents encoded to BSON up front: the driver then splices
+            # raw bytes into the wire message instead of re-walking each
+            # dict during the send. Mixed or unannotated groups - where
+            # custom codec behavior may matter - keep plain dicts.
+            cls0 = type(group[0])
+            pre_encode = (
+                len(group) > 1
+                and cls0._field_names is not None
+                and all(type(instance) is cls0 for instance in group)
+            )
+
+            requests = []
+            for instance in group:
+                data = instance.to_dict()
+                data.pop('_id', None)
+                if instance._id:
+                    requests.append(
+                        UpdateOne({"_id": instance._id}, {"$set": data})
+                    )
+                else:
+                    data["_id"] = ObjectId()
+                    instance._id = data["_id"]
+                    if pre_encode:
+                        data = RawBSONDocument(bson.encode(data))
+                    requests.append(InsertOne(data))
+
+            collection = conn.collection(collection_name)
+            collection.bulk_write(
+                requests,
+                ordered=False,
+                bypass_document_validation=bypass_document_validation,
+                session=session or conn._active_session
+            )
+
+    def delete(self, connection: Connection | None = None, session=None) -> None:
         """Delete the model instance"""
         if not self._id:
             raise ProgrammingError("Cannot delete unsaved document")
-        
+
         conn = connection or self._connection
         if not conn:
             raise ProgrammingError("No connection available")
-        
+
         collection_name = self._get_collection_name()
         collection = conn.collection(collection_name)
-        collection.delete_one({"_id": self._id})
+        session = session or conn._active_session
+        collection.delete_one({"_id": self._id}, session=session)
         self._id = None
 
     @classmethod
-    def find(cls, id: Any, connection: Connection | None = None) -> Optional['Model']:
+    def find(cls, id: Any, connection: Connection | None = None, session=None) -> Optional['Model']:
         """Find a record by ID"""
         conn = connection or cls._connection
         if not conn:
@@ -77,49 +163,65 @@ class Model:
         collection_name = cls._get_collection_name()
         collection = conn.collection(collection_name)
         
-        # Convert string to ObjectId if needed
-        if isinstance(id, str):
-            try:
-                id = ObjectId(id)
-            except:
-                pass
-        
-        doc = collection.find_one({"_id": id})
+        # Convert string to ObjectId if it looks like one; other strings
+        # pass through as literal keys. The explicit check replaces a bare
+        # try/except that both swallowed real errors and paid exception
+        # overhead on every non-ObjectId key
+        if isinstance(id, str) and len(id) == 24 and _HEX_DIGITS.issuperset(id):
+            id = _to_oid(id)
         
+        doc = collection.find_one(
+            {"_id": id}, session=session or conn._active_session
+        )
+
         if doc:
             return cls._from_document(doc)
         return None
 
     @classmethod
-    def find_one(cls, filter: dict, connection: Connection | None = None) -> Optional['Model']:
+    def find_one(cls, filter: dict, connection: Connection | None = None, session=None) -> Optional['Model']:
         """Find one document matching filter"""
         conn = connection or cls._connection
         if not conn:
             raise ProgrammingError("No connection available")
-        
+
         collection_name = cls._get_collection_name()
         collection = conn.collection(collection_name)
-        doc = collection.find_one(filter)
+        doc = collection.find_one(filter, session=session or conn._active_session)
         
         if doc:
             return cls._from_document(doc)
         return None
 
     @classmethod
-    def find_many(cls, filter: dict = None, connection: Connection | None = None) -> list['Model']:
-        """Find many documents matching filter"""
+    def find_many(
+            cls,
+            filter: dict = None,
+            connection: Connection | None = None,
+            only: Iterable[str] | None = None,
+            session=None
+    ) -> list['Model']:
+        """Find many documents matching filter.
+
+        Pass only= to project just those fields server-side; _id is kept
+        so the resulting instances remain saveable.
+        """
         conn = connection or cls._connection
         if not conn:
             raise ProgrammingError("No connection available")
-        
+
         collection_name = cls._get_collection_name()
         collection = conn.collection(collection_name)
-        
+
         if filter is None:
             filter = {}
-        
-        cursor = collection.find(filter)
-        return [cls._from_document(doc) for doc in cursor]
+
+        projection = {field: 1 for field in only} if only else None
+        cursor = collection.find(
+            filter, projection, session=session or conn._active_session
+        )
+        _from = cls._from_document
+        return [_from(doc) for doc in cursor]
 
     @classmethod
     def all(cls, connection: Connection | None = None) -> list['Model']:
@@ -130,19 +232,23 @@ class Model:
     def _from_document(cls, doc: dict) -> 'Model':
         """Create model instance from database document"""
         instance = cls.__new__(cls)
-        
-        for key, value in doc.items():
-            setattr(instance, key, value)
-        
+        # One C-level dict merge instead of a setattr per field
+        instance.__dict__.update(doc)
         return instance
 
     def to_dict(self) -> dict:
         """Convert model to dictionary"""
-        data = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_') or key == '_id':
-                data[key] = value
-        return data
+        d = self.__dict__
+        fields = self._field_names
+        if fields is not None:
+            data = {key: d[key] for key in fields if key in d}
+            if '_id' in d:
+                data['_id'] = d['_id']
+            return data
+        return {
+            key: value for key, value in d.items()
+            if not key.startswith('_') or key == '_id'
+        }
 
     def __repr__(self) -> str:
         """String representation"""
@@ -1,36 +1,129 @@
 """Query Builder and utilities for MongoDB"""
 
-from typing import Any, Optional
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
 from ..core.connection import Connection
 from ..core.cursor import Cursor
 
+# Maximum number of compiled query shapes kept by QueryBuilder.prepare()
+PREPARED_CACHE_SIZE = 1000
+
+# How long cached index_information() results stay fresh, in seconds
+INDEX_CACHE_TTL = 10.0
+
+
+class NegativeCache:
+    """Bounded cache of values known to be absent per (collection, field)"""
+
+    def __init__(self, max_size: int = 100_000):
+        self._max_size = max_size
+        self._absent: dict[tuple[str, str], set] = {}
+        self._size = 0
+
+    def add(self, collection: str, field: str, values: Iterable) -> None:
+        """Record values known not to exist in collection.field"""
+        absent = self._absent.setdefault((collection, field), set())
+        for value in values:
+            if self._size >= self._max_size:
+                return
+            if value not in absent:
+                absent.add(value)
+                self._size += 1
+
+    def discard(self, collection: str, field: str) -> None:
+        """Drop cached absences (call after writes to the collection)"""
+        dropped = self._absent.pop((collection, field), None)
+        if dropped:
+            self._size -= len(dropped)
+
+    def prune(self, collection: str, field: str, values: Iterable) -> list:
+        """Filter out values known to be absent"""
+        absent = self._absent.get((collection, field))
+        if not absent:
+            return list(values)
+        return [value for value in values if value not in absent]
+
+
+# Heuristic selectivity per operator (expected fraction of documents that
+# match a clause). Used to order compound filters when no sampled estimate
+# is cached: cheap-rejecting clauses should run first.
+DEFAULT_SELECTIVITY = {
+    "$eq": 0.05,
+    "$in": 0.15,
+    "$gt": 0.3,
+    "$gte": 0.3,
+    "$lt": 0.3,
+    "$lte": 0.3,
+    "$regex": 0.6,
+    "$exists": 0.7,
+    "$ne": 0.9,
+    "$nin": 0.9,
+}
+
 
 class QueryBuilder:
     """Simple query builder for MongoDB"""
 
+    # Sampled selectivity estimates shared across builders,
+    # keyed by (collection, field, operator)
+    _selectivity_cache: dict[tuple[str, str, str], float] = {}
+
+    # Values known to be absent, shared across builders so repeated batch
+    # lookups skip keys that can never match
+    negative_cache = NegativeCache()
+
+    # Compiled query closures keyed by structural signature, evicted LRU
+    _prepared_cache: OrderedDict = OrderedDict()
+
+    # index_information() results per collection, each stamped with the
+    # monotonic time it was fetched
+    _index_cache: dict[str, tuple[float, dict]] = {}
+
     def __init__(self, connection: Connection, collection: str):
         self._conn = connection
         self._collection = collection
         self._filter: dict = {}
         self._projection: dict | None = None
-        self._sort: list[tuple] = []
+        self._sort_spec: list = []
         self._limit: int | None = None
         self._skip: int | None = None
+        self._ordered: dict = {}
+        self._sort_built: list[tuple] | None = None
+        self._built: dict | None = None
+        self._dirty = True
 
     def filter(self, **kwargs) -> 'QueryBuilder':
         """Add filter conditions"""
         self._filter.update(kwargs)
+        self._dirty = True
         return self
 
     def where(self, condition: dict) -> 'QueryBuilder':
         """Add WHERE condition (alias for filter)"""
         self._filter.update(condition)
+        self._dirty = True
+        return self
+
+    def filter_in(self, field: str, values: Iterable) -> 'QueryBuilder':
+        """Match field against a batch of values with a single $in clause.
+
+        Collapses N equality lookups into one query; values cached as
+        known-absent for this collection/field are pruned client-side
+        before the query is issued.
+        """
+        self._filter[field] = {
+            "$in": self.negative_cache.prune(self._collection, field, values)
+        }
+        self._dirty = True
         return self
 
     def select(self, *fields: str) -> 'QueryBuilder':
         """Set projection fields"""
         if fields:
             self._projection = {field: 1 for field in fields}
+            self._dirty = True
         return self
 
     def exclude(self, *fields: str) -> 'QueryBuilder':
@@ -40,21 +133,18 @@ class QueryBuilder:
                 self._projection = {}
             for field in fields:
                 self._projection[field] = 0
+            self._dirty = True
         return self
 
     def sort(self, *fields: str, **kwargs) -> 'QueryBuilder':
         """Add sort criteria"""
-        # Support both sort("field1", "field2") and sort(field1=1, field2=-1)
-        if fields:
-            # Default to ascending
-            for field in fields:
-                if field.startswith('-'):
-                    self._sort.append((field[1:], -1))
-                else:
-                    self._sort.append((field, 1))
+        # Support both sort("field1", "field2") and sort(field1=1, field2=-1);
+        # raw specs are accumulated here and parsed once on finalization
+        self._sort_spec.extend(fields)
         if kwargs:
             for field, direction in kwargs.items():
-                self._sort.append((field, 1 if direction > 0 else -1))
+                self._sort_spec.append((field, 1 if direction > 0 else -1))
+        self._dirty = True
         return self
 
     def order_by(self, *fields: str) -> 'QueryBuilder':
@@ -64,59 +154,258 @@ class QueryBuilder:
     def limit(self, n: int) -> 'QueryBuilder':
         """Set LIMIT"""
         self._limit = n
+        self._dirty = True
         return self
 
     def skip(self, n: int) -> 'QueryBuilder':
         """Set SKIP/OFFSET"""
         self._skip = n
+        self._dirty = True
         return self
 
     def offset(self, n: int) -> 'QueryBuilder':
         """Set OFFSET (alias for skip)"""
         return self.skip(n)
 
+    def prepare(self) -> Callable[..., Cursor]:
+        """Compile this builder's query shape into a reusable callable.
+
+        The callable takes one keyword argument per filter field and
+        issues the find directly, so loops that reissue the same shape
+        with different values skip all per-call dict rebuilding:
+
+            run = query(conn, "users").filter(sku=None).limit(1).prepare()
+            cursor = run(sku="a-1")
+
+        Compiled shapes are cached per (collection, fields, projection,
+        sort, limit, skip) signature with LRU eviction.
+        """
+        self._finalize()
+        signature = (
+            self._collection,
+            tuple(self._filter.keys()),
+            tuple(self._projection.items()) if self._projection else None,
+            tuple(self._sort_built or ()),
+            self._limit,
+            self._skip,
+        )
+        compiled = self._prepared_cache.get(signature)
+        if compiled is None:
+            compiled = self._compile(signature)
+            self._prepared_cache[signature] = compiled
+            if len(self._prepared_cache) > PREPARED_CACHE_SIZE:
+                self._prepared_cache.popitem(last=False)
+        else:
+            self._prepared_cache.move_to_end(signature)
+        return functools.partial(compiled, self._conn)
+
+    @staticmethod
+    def _compile(signature: tuple) -> Callable[..., Cursor]:
+        """Build the execution closure for a query signature"""
+        collection, fields, projection_items, sort, limit, skip = signature
+        projection = dict(projection_items) if projection_items else None
+
+        # The shape is fixed, so decide the kwargs once at compile time;
+        # pymongo's find rejects limit=None/skip=None outright
+        extra: dict[str, Any] = {}
+        if sort:
+            extra["sort"] = list(sort)
+        if limit is not None:
+            extra["limit"] = limit
+        if skip is not None:
+            extra["skip"] = skip
+
+        def _exec(conn: Connection, **values) -> Cursor:
+            cursor = conn.execute(
+                collection,
+                "find",
+                {field: values[field] for field in fields},
+                projection,
+                **extra
+            )
+            return cursor
+
+        return _exec
+
+    @staticmethod
+    def _clause_op(value: Any) -> str:
+        """Get the MongoDB operator a clause value represents"""
+        if isinstance(value, dict):
+            for key in value:
+                if key.startswith('$'):
+                    return key
+        return "$eq"
+
+    def _estimate_selectivity(self, field: str, value: Any) -> float:
+        """Estimate the fraction of documents a clause matches"""
+        if field == "$or" and isinstance(value, list):
+            # An $or matches at most the sum of its branches
+            return min(1.0, sum(
+                self._estimate_selectivity(f, v)
+                for branch in value if isinstance(branch, dict)
+                for f, v in branch.items()
+            ))
+        if field.startswith('$'):
+            return 0.5
+        op = self._clause_op(value)
+        cached = self._selectivity_cache.get((self._collection, field, op))
+        if cached is not None:
+            return cached
+        return DEFAULT_SELECTIVITY.get(op, 0.5)
+
+    def sample_selectivity(self, sample_size: int = 1000) -> None:
+        """Estimate selectivity of the current filter clauses from a sampled
+        aggregation and cache the results for future builds"""
+        for field, value in self._filter.items():
+            if field.startswith('$'):
+                continue
+            cursor = self._conn.execute(
+                self._collection,
+                "aggregate",
+                [
+                    {"$sample": {"size": sample_size}},
+                    {"$match": {field: value}},
+                    {"$count": "n"},
+                ]
+            )
+            counted = next(iter(cursor.result), None)
+            matched = counted["n"] if counted else 0
+            key = (self._collection, field, self._clause_op(value))
+            self._selectivity_cache[key] = matched / sample_size
+
+    def _ordered_filter(self) -> dict:
+        """Order compound filters so the most selective clauses run first"""
+        if len(self._filter) < 2:
+            return self._filter
+
+        clauses = sorted(
+            self._filter.items(),
+            key=lambda item: self._estimate_selectivity(*item)
+        )
+        ordered = []
+        for field, value in clauses:
+            if field == "$or" and isinstance(value, list):
+                # Within an OR the most likely branch should match first
+                value = sorted(
+                    value,
+                    key=lambda branch: -self._estimate_selectivity(
+                        *next(iter(branch.items()))
+                    ) if branch else 0.0
+                )
+            ordered.append({field: value})
+        return {"$and": ordered}
+
+    def _finalize(self) -> None:
+        """Apply pending mutations (filter ordering, sort parsing,
+        cache invalidation)"""
+        if self._dirty:
+            self._ordered = self._ordered_filter()
+            self._sort_built = self._parse_sort()
+            self._built = None
+            self._dirty = False
+
+    def _parse_sort(self) -> list[tuple] | None:
+        """Normalize accumulated sort specs to (field, direction) pairs"""
+        if not self._sort_spec:
+            return None
+        pairs = []
+        for item in self._sort_spec:
+            if isinstance(item, str):
+                if item[0] == '-':
+                    pairs.append((item[1:], -1))
+                else:
+                    pairs.append((item, 1))
+            else:
+                pairs.append(item)
+        return pairs
+
     def build(self) -> dict:
-        """Build MongoDB query parameters"""
+        """Build MongoDB query parameters (memoized until the next mutator)"""
+        self._finalize()
+        if self._built is not None:
+            return self._built
+
         params = {
-            "filter": self._filter,
+            "filter": self._ordered,
         }
         if self._projection:
             params["projection"] = self._projection
-        if self._sort:
-            params["sort"] = self._sort
+        if self._sort_built:
+            params["sort"] = self._sort_built
         if self._limit is not None:
             params["limit"] = self._limit
         if self._skip is not None:
             params["skip"] = self._skip
+        self._built = params
         return params
 
     def find_one(self) -> dict | None:
         """Execute find_one query"""
-        params = self.build()
+        self._finalize()
         cursor = self._conn.execute(
             self._collection,
             "find_one",
-            params.get("filter", {}),
-            params.get("projection")
+            self._ordered,
+            self._projection
         )
-        cursor.execute()
         return cursor.fetchone()
 
     def find(self) -> Cursor:
         """Execute find query"""
-        params = self.build()
+        self._finalize()
+        kwargs = {}
+        if self._sort_built:
+            kwargs["sort"] = self._sort_built
+        if self._limit is not None:
+            kwargs["limit"] = self._limit
+        if self._skip is not None:
+            kwargs["skip"] = self._skip
         cursor = self._conn.execute(
             self._collection,
             "find",
-            params.get("filter", {}),
-            params.get("projection"),
-            sort=params.get("sort"),
-            limit=params.get("limit"),
-            skip=params.get("skip")
+            self._ordered,
+            self._projection,
+            **kwargs
         )
-        cursor.execute()
         return cursor
 
+    async def afind(self) -> list[dict]:
+        """Execute find asynchronously (requires an AsyncConnection).
+
+        Independent queries can be overlapped:
+            docs_a, docs_b = await asyncio.gather(qa.afind(), qb.afind())
+        """
+        self._finalize()
+        cursor = self._conn.collection(self._collection).find(
+            self._ordered, self._projection
+        )
+        if self._sort_built:
+            cursor = cursor.sort(self._sort_built)
+        if self._skip is not None:
+            cursor = cursor.skip(self._skip)
+        if self._limit is not None:
+            cursor = cursor.limit(self._limit)
+        return await cursor.to_list(length=None)
+
+    async def afind_one(self) -> dict | None:
+        """Execute find_one asynchronously (requires an AsyncConnection)"""
+        self._finalize()
+        return await self._conn.collection(self._collection).find_one(
+            self._ordered, self._projection
+        )
+
+    async def acount(self, estimated: bool = False) -> int:
+        """Count documents asynchronously (requires an AsyncConnection).
+
+        estimated=True answers from collection metadata for an empty
+        filter; approximate, see count().
+        """
+        self._finalize()
+        collection = self._conn.collection(self._collection)
+        if estimated and not self._ordered:
+            return await collection.estimated_document_count()
+        return await collection.count_documents(self._ordered)
+
     def fetchone(self) -> dict | None:
         """Fetch one document"""
         return self.find_one()
@@ -130,63 +419,106 @@ class QueryBuilder:
         cursor = self.find()
         return cursor.fetchmany(size)
 
-    def count(self) -> int:
-        """Count documents matching the query"""
-        params = self.build()
+    def _index_information(self) -> dict:
+        """Get the collection's index information, cached with a short TTL"""
+        now = time.monotonic()
+        cached = self._index_cache.get(self._collection)
+        if cached is not None and now - cached[0] < INDEX_CACHE_TTL:
+            return cached[1]
+        try:
+            info = self._conn.collection(self._collection).index_information()
+        except Exception:
+            info = {}
+        self._index_cache[self._collection] = (now, info)
+        return info
+
+    def _pick_hint(self) -> str | None:
+        """Pick an index hint when the filter starts with an obviously
+        indexed single-field equality"""
+        first_key = next(iter(self._filter), None)
+        if first_key is None or first_key.startswith('$'):
+            return None
+        if isinstance(self._filter[first_key], dict):
+            return None
+        for name, spec in self._index_information().items():
+            # Partial and sparse indexes only cover documents matching
+            # their own predicate; hinting one onto an arbitrary filter
+            # can silently undercount
+            if "partialFilterExpression" in spec or spec.get("sparse"):
+                continue
+            key = spec.get("key")
+            if key and key[0][0] == first_key:
+                return name
+        return None
+
+    def count(self, estimated: bool = False) -> int:
+        """Count documents matching the query.
+
+        With estimated=True and no filter, answer from collection
+        metadata instead of scanning documents — much cheaper, but the
+        figure is approximate, can drift after an unclean shutdown, and
+        ignores any open transaction. The default stays an exact
+        count_documents.
+        """
+        self._finalize()
+        if estimated and not self._ordered:
+            cursor = self._conn.execute(
+                self._collection,
+                "estimated_document_count"
+            )
+            return cursor.rowcount
+
+        hint = self._pick_hint()
         cursor = self._conn.execute(
             self._collection,
             "count_documents",
-            params.get("filter", {})
+            self._ordered,
+            **({"hint": hint} if hint else {})
         )
-        cursor.execute()
         return cursor.rowcount
 
     def update_one(self, update: dict, upsert: bool = False) -> Any:
         """Update one document"""
-        params = self.build()
+        self._finalize()
         cursor = self._conn.execute(
             self._collection,
             "update_one",
-            params.get("filter", {}),
+            self._ordered,
             update,
             upsert=upsert
         )
-        cursor.execute()
         return cursor.result
 
     def update_many(self, update: dict, upsert: bool = False) -> Any:
         """Update many documents"""
-        params = self.build()
+        self._finalize()
         cursor = self._conn.execute(
             self._collection,
             "update_many",
-            params.get("filter", {}),
+            self._ordered,
             update,
             upsert=upsert
         )
-        cursor.execute()
         return cursor.result
 
     def delete_one(self) -> Any:
         """Delete one document"""
-        params = self.build()
+        self._finalize()
         cursor = self._conn.execute(
             self._collection,
             "delete_one",
-            params.get("filter", {})
+            self._ordered
         )
-        cursor.execute()
         return cursor.result
 
     def delete_many(self) -> Any:
         """Delete many documents"""
-        params = self.build()
+        self._finalize()
         cursor = self._conn.execute(
             self._collection,
             "delete_many",
-            params.get("filter", {})
+            self._ordered
         )
-        cursor.execute()
         return cursor.result
 
 
@@ -1,15 +1,42 @@
 """Schema Management for MongoDB"""
 
-from typing import Any, Optional, list as ListType
+import time
+
+from typing import Any, Iterator, Optional
+
+from pymongo import IndexModel
+from pymongo.errors import CollectionInvalid, OperationFailure
+
 from ..core.connection import Connection
 from ..core.exceptions import ProgrammingError
 
+# Server error code for "namespace already exists"
+_NAMESPACE_EXISTS = 48
+
+# How long a cached collection listing stays fresh (seconds); schema sync
+# code tends to call get_collections in bursts
+_COLLECTIONS_TTL = 10.0
+
 
 class Schema:
     """Schema management utilities for MongoDB"""
 
     def __init__(self, connection: Connection):
         self._conn = connection
+        self._collections_cache: list[str] | None = None
+        self._collections_cached_at = 0.0
+        self._collections_cached_db = None
+
+    @property
+    def _database(self):
+        """Current database handle.
+
+        Read from the connection every time: Connection.use_database
+        rebinds the handle in place, and a copy cached here would keep
+        routing schema commands at the old database. The read is just a
+        guarded attribute access, so there is nothing worth caching.
+        """
+        return self._conn.database
 
     def create_collection(
             self,
@@ -30,7 +57,7 @@ class Schema:
             **kwargs: Additional options (capped, size, max, etc.)
         """
         try:
-            db = self._conn.database
+            db = self._database
             options = kwargs.copy()
             
             if validator:
@@ -39,24 +66,28 @@ class Schema:
                 options["validationAction"] = validation_action
             
             db.create_collection(name, **options)
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                pass  # Collection already exists
-            else:
+            self._collections_cache = None
+        except CollectionInvalid:
+            pass  # Collection already exists
+        except OperationFailure as e:
+            if e.code != _NAMESPACE_EXISTS:
                 raise ProgrammingError(f"Failed to create collection: {e}")
+        except Exception as e:
+            raise ProgrammingError(f"Failed to create collection: {e}")
 
     def drop_collection(self, name: str) -> None:
         """Drop a collection"""
         try:
-            db = self._conn.database
+            db = self._database
             db.drop_collection(name)
+            self._collections_cache = None
         except Exception as e:
             raise ProgrammingError(f"Failed to drop collection: {e}")
 
     def create_index(
             self,
             collection: str,
-            keys: ListType[tuple[str, int]] | dict,
+            keys: list[tuple[str, int]] | dict,
             name: str | None = None,
             unique: bool = False,
             sparse: bool = False,
@@ -76,8 +107,6 @@ class Schema:
             **kwargs: Additional index options
         """
         try:
-            coll = self._conn.collection(collection)
-            
             # Convert dict to list of tuples if needed
             if isinstance(keys, dict):
                 keys = list(keys.items())
@@ -91,11 +120,43 @@ class Schema:
             
             if name:
                 index_options["name"] = name
-            
-            return coll.create_index(keys, **index_options)
+
+            return self.create_indexes(
+                collection, [{"keys": keys, "options": index_options}]
+            )[0]
+        except ProgrammingError:
+            raise
         except Exception as e:
             raise ProgrammingError(f"Failed to create index: {e}")
 
+    def create_indexes(
+            self,
+            collection: str,
+            specs: list[dict]
+    ) -> list[str]:
+        """
+        Create several indexes with one createIndexes command.
+
+        Args:
+            collection: Collection name
+            specs: List of {"keys": ..., "options": {...}} dicts, where
+                keys is a list of (field, direction) tuples or a dict
+
+        One round-trip builds them all, instead of one command per index
+        as repeated create_index calls would issue.
+        """
+        try:
+            coll = self._conn.collection(collection)
+            models = []
+            for spec in specs:
+                keys = spec["keys"]
+                if isinstance(keys, dict):
+                    keys = list(keys.items())
+                models.append(IndexModel(keys, **spec.get("options", {})))
+            return coll.create_indexes(models)
+        except Exception as e:
+            raise ProgrammingError(f"Failed to create indexes: {e}")
+
     def drop_index(self, collection: str, index_name: str) -> None:
         """Drop an index from a collection"""
         try:
@@ -104,35 +165,61 @@ class Schema:
         except Exception as e:
             raise ProgrammingError(f"Failed to drop index: {e}")
 
-    def get_collections(self) -> ListType[str]:
+    def get_collections(self) -> list[str]:
         """Get list of collections in the database"""
         try:
-            db = self._conn.database
-            return db.list_collection_names()
+            now = time.monotonic()
+            db = self._database
+            # The cached listing only counts for the database it came
+            # from; use_database rebinds the handle
+            if (self._collections_cache is not None
+                    and db is self._collections_cached_db
+                    and now - self._collections_cached_at < _COLLECTIONS_TTL):
+                return self._collections_cache
+            self._collections_cache = db.list_collection_names()
+            self._collections_cached_at = now
+            self._collections_cached_db = db
+            return self._collections_cache
         except Exception as e:
             raise ProgrammingError(f"Failed to get collections: {e}")
 
     def collection_exists(self, name: str) -> bool:
         """Check if a collection exists"""
         try:
-            db = self._conn.database
-            return name in db.list_collection_names()
+            # Server-side filter: returns at most one name instead of
+            # shipping the whole namespace list over the wire
+            return bool(self._database.list_collection_names(
+                filter={"name": name}
+            ))
         except Exception as e:
             raise ProgrammingError(f"Failed to check collection existence: {e}")
 
-    def get_indexes(self, collection: str) -> ListType[dict]:
-        """Get list of indexes for a collection"""
+    def get_indexes(self, collection: str) -> Iterator[dict]:
+        """Iterate over the indexes of a collection.
+
+        Returns the server cursor directly rather than materializing a
+        list, so callers scanning for one index can stop early.
+        """
         try:
             coll = self._conn.collection(collection)
-            return list(coll.list_indexes())
+            return coll.list_indexes()
         except Exception as e:
             raise ProgrammingError(f"Failed to get indexes: {e}")
 
+    def has_index(self, collection: str, name: str) -> bool:
+        """Check whether a collection has an index with the given name"""
+        try:
+            coll = self._conn.collection(collection)
+            return any(idx["name"] == name for idx in coll.list_indexes())
+        except Exception as e:
+            raise ProgrammingError(f"Failed to check index existence: {e}")
+
     def rename_collection(self, old_name: str, new_name: str) -> None:
         """Rename a collection"""
         try:
-            db = self._conn.database
+            db = self._database
             db[old_name].rename(new_name)
+            self._collections_cache = None
         except Exception as e:
             raise ProgrammingError(f"Failed to rename collection: {e}")
 
@@ -24,11 +24,15 @@ class Transaction:
             self._started = True
         except Exception as e:
             raise DatabaseError(f"Failed to start transaction: {e}")
-        
+
+        # Operations on the connection inside the block run in this
+        # session without each call site passing it explicitly
+        self._conn._active_session = self._session
         return self._conn
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """End transaction"""
+        self._conn._active_session = None
         if self._session:
             try:
                 if exc_type is None:
@@ -38,11 +38,25 @@ class MongoApp:
     def _create_connection(self):
         """Create connection from config"""
         conn_type = self.config.mongodb.get('connection_type', 'local')
-        
+
+        extra = {}
+        if self.config.mongodb.get('fast_insert', False):
+            # Unacknowledged writes for high-volume ingestion
+            extra['write_concern'] = 0
+
+        pool = self.config.mongodb.get('pool')
+        if pool:
+            for key in ('max_pool_size', 'min_pool_size',
+                        'max_idle_time_ms', 'wait_queue_timeout_ms'):
+                value = pool.get(key)
+                if value is not None:
+                    extra[key] = value
+
         if conn_type == 'atlas':
             return connect(
                 dsn=self.config.mongodb.atlas.connection_string,
-                database=self.config.mongodb.atlas.get('database', self.config.mongodb.database)
+                database=self.config.mongodb.atlas.get('database', self.config.mongodb.database),
+                **extra
             )
         else:
             local = self.config.mongodb.local
@@ -52,7 +66,8 @@ class MongoApp:
                 database=local.get('database', 'test'),
                 username=local.get('username'),
                 password=local.get('password'),
-                auth_source=local.get('auth_source', 'admin')
+                auth_source=local.get('auth_source', 'admin'),
+                **extra
             )
     
     def close(self):
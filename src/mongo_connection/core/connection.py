@@ -10,6 +10,35 @@ from .cursor import Cursor
 from .document_factory import DocumentFactory
 from .exceptions import InterfaceError
 
+# Import pymongo once at module load; the error for a missing driver is
+# deferred to connect() so merely importing this package stays cheap and
+# dependency-free
+try:
+    from pymongo import MongoClient
+    from pymongo.read_preferences import ReadPreference
+    from pymongo.write_concern import WriteConcern
+    from pymongo.read_concern import ReadConcern
+except ImportError:
+    MongoClient = None
+
+if MongoClient is not None:
+    _READ_PREF_MAP = {
+        "primary": ReadPreference.PRIMARY,
+        "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+        "secondary": ReadPreference.SECONDARY,
+        "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+        "nearest": ReadPreference.NEAREST,
+    }
+else:
+    _READ_PREF_MAP = {}
+
+# Long-lived MongoClient instances shared across Connection objects with
+# identical configuration. The client *is* the pool: recreating it per
+# Connection pays the TCP+TLS+auth handshake again, so workers that build
+# connections repeatedly reuse one client for the life of the process.
+_CLIENT_CACHE: dict[tuple, object] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 
 class Connection:
     """MongoDB database connection"""
@@ -31,6 +60,11 @@ class Connection:
             write_concern: int | str = DEFAULT_WRITE_CONCERN,
             read_concern: str = DEFAULT_READ_CONCERN,
             document_factory: type | None = None,
+            compressors: str | None = None,
+            max_pool_size: int | None = None,
+            min_pool_size: int | None = None,
+            max_idle_time_ms: int | None = None,
+            wait_queue_timeout_ms: int | None = None,
     ):
         """
         Create a MongoDB connection.
@@ -51,6 +85,12 @@ class Connection:
             write_concern: Write concern level
             read_concern: Read concern level
             document_factory: Custom document factory
+            compressors: Comma-separated wire compressors to negotiate
+                with the server (e.g. "zstd,snappy,zlib")
+            max_pool_size: Driver pool maxPoolSize
+            min_pool_size: Driver pool minPoolSize
+            max_idle_time_ms: Driver pool maxIdleTimeMS
+            wait_queue_timeout_ms: Driver pool waitQueueTimeoutMS
         """
         self._dsn = dsn
         self._host = host
@@ -66,11 +106,24 @@ class Connection:
         self._read_preference = read_preference
         self._write_concern = write_concern
         self._read_concern = read_concern
-        self._thread_ident = threading.get_ident()
+        self._compressors = compressors
+        self._max_pool_size = max_pool_size
+        self._min_pool_size = min_pool_size
+        self._max_idle_time_ms = max_idle_time_ms
+        self._wait_queue_timeout_ms = wait_queue_timeout_ms
         self._document_factory: DocumentFactory | None = document_factory
         self._client = None
         self._db = None
         self._closed = False
+        # Collections verified to exist on this connection; monotonic,
+        # so membership checks are thread-safe
+        self._known_collections: set[str] = set()
+        # Collection handles by name, so repeat lookups skip the closed
+        # check and Database.__getitem__
+        self._collection_cache: dict[str, object] = {}
+        # Session attached by an enclosing Transaction; operations that
+        # do not pass an explicit session pick it up automatically
+        self._active_session = None
 
     def __enter__(self):
         """Context manager entry"""
@@ -86,12 +139,10 @@ class Connection:
         if self._client is not None:
             return
 
-        try:
-            from pymongo import MongoClient
-            from pymongo.read_preferences import ReadPreference
-            from pymongo.write_concern import WriteConcern
-            from pymongo.read_concern import ReadConcern
+        if MongoClient is None:
+            raise InterfaceError("pymongo is required. Install it with: pip install pymongo")
 
+        try:
             # Build connection parameters
             if self._dsn:
                 client_params = {"host": self._dsn}
@@ -115,48 +166,75 @@ class Connection:
             })
             if self._socket_timeout:
                 client_params["socketTimeoutMS"] = int(self._socket_timeout * 1000)
+            if self._compressors:
+                client_params["compressors"] = self._compressors
+            if self._max_pool_size is not None:
+                client_params["maxPoolSize"] = self._max_pool_size
+            if self._min_pool_size is not None:
+                client_params["minPoolSize"] = self._min_pool_size
+            if self._max_idle_time_ms is not None:
+                client_params["maxIdleTimeMS"] = self._max_idle_time_ms
+            if self._wait_queue_timeout_ms is not None:
+                client_params["waitQueueTimeoutMS"] = self._wait_queue_timeout_ms
 
-            # Create client
-            self._client = MongoClient(**client_params)
+            # Reuse an existing client for identical parameters; clients are
+            # thread-safe and hold the driver's connection pool, so sharing
+            # one avoids repeated handshakes
+            cache_key = tuple(sorted(client_params.items()))
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(cache_key)
+                if client is None:
+                    client = MongoClient(**client_params)
+                    _CLIENT_CACHE[cache_key] = client
+            self._client = client
 
-            # Get database
+            # One get_database call with all options instead of chaining
+            # with_options, which builds a throwaway Database proxy each time
             db_name = self._database or DEFAULT_DATABASE
-            self._db = self._client[db_name]
-
-            # Set read preference, write concern, read concern
-            if self._read_preference:
-                read_pref_map = {
-                    "primary": ReadPreference.PRIMARY,
-                    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
-                    "secondary": ReadPreference.SECONDARY,
-                    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
-                    "nearest": ReadPreference.NEAREST,
-                }
-                read_pref = read_pref_map.get(self._read_preference, ReadPreference.PRIMARY)
-                self._db = self._db.with_options(read_preference=read_pref)
+            self._db = self._client.get_database(db_name, **self._db_options())
 
-            if self._write_concern:
-                if isinstance(self._write_concern, str):
-                    wc = WriteConcern(w=self._write_concern)
-                else:
-                    wc = WriteConcern(w=self._write_concern)
-                self._db = self._db.with_options(write_concern=wc)
-
-            if self._read_concern:
-                rc = ReadConcern(level=self._read_concern)
-                self._db = self._db.with_options(read_concern=rc)
-
-        except ImportError:
-            raise InterfaceError("pymongo is required. Install it with: pip install pymongo")
         except Exception as e:
             raise InterfaceError(f"Failed to connect to MongoDB: {e}")
 
+    def _db_options(self) -> dict:
+        """Database options derived from the connection settings"""
+        db_options = {}
+        if self._read_preference:
+            db_options["read_preference"] = _READ_PREF_MAP.get(
+                self._read_preference, ReadPreference.PRIMARY
+            )
+        # "is not None" so write_concern=0 (unacknowledged) is honored
+        if self._write_concern is not None:
+            db_options["write_concern"] = WriteConcern(w=self._write_concern)
+        if self._read_concern:
+            db_options["read_concern"] = ReadConcern(level=self._read_concern)
+        return db_options
+
+    def use_database(self, name: str) -> None:
+        """Switch this connection to another database in place.
+
+        The client multiplexes every database over one pooled socket
+        set, so switching is a handle rebind — no teardown, server
+        selection or auth handshake like close() + connect() would pay.
+        """
+        if self._closed or self._client is None:
+            raise InterfaceError("Connection is closed")
+        self._database = name
+        self._db = self._client.get_database(name, **self._db_options())
+        self._collection_cache.clear()
+        self._known_collections.clear()
+
     def close(self):
-        """Close the connection"""
-        if self._client:
-            self._client.close()
-            self._client = None
-            self._db = None
+        """Close the connection.
+
+        The underlying client may be shared with other Connection objects,
+        so only the reference is dropped here; the pooled client stays
+        alive for the process (see close_all_clients to tear them down).
+        """
+        self._client = None
+        self._db = None
+        self._collection_cache.clear()
+        self._active_session = None
         self._closed = True
 
     @property
@@ -173,9 +251,24 @@ class Connection:
 
     def collection(self, name: str):
         """Get a collection object"""
+        coll = self._collection_cache.get(name)
+        if coll is None:
+            if self._closed or self._db is None:
+                raise InterfaceError("Connection is closed")
+            coll = self._db[name]
+            self._collection_cache[name] = coll
+        return coll
+
+    def fast_collection(self, name: str):
+        """Get a collection with unacknowledged writes (w=0).
+
+        Writes return as soon as the message is sent, without waiting for
+        a server acknowledgement - a large throughput win for bulk
+        ingestion, at the cost of not noticing failed writes.
+        """
         if self._closed or self._db is None:
             raise InterfaceError("Connection is closed")
-        return self._db[name]
+        return self._db[name].with_options(write_concern=WriteConcern(w=0))
 
     @property
     def database(self):
@@ -192,6 +285,18 @@ class Connection:
         return self._client
 
 
+def close_all_clients():
+    """Close and forget every cached MongoClient.
+
+    Intended for process shutdown or tests; Connection objects created
+    afterwards get fresh clients.
+    """
+    with _CLIENT_CACHE_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+
 def connect(
         dsn: str | None = None,
         host: str | None = None,
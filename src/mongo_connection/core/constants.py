@@ -35,6 +35,9 @@ DEFAULT_PORT = 27017
 DEFAULT_HOST = "localhost"
 DEFAULT_DATABASE = "test"
 
+# Server batch size for find/aggregate cursors
+DEFAULT_BATCH_SIZE = 2000
+
 # Thread safety
 class ThreadSafety(IntEnum):
     """Thread safety levels"""
@@ -49,6 +52,7 @@ THREADSAFETY = ThreadSafety.THREADSAFE  # MongoDB connections are thread-safe
 DEFAULT_MIN_CONNECTIONS = 1
 DEFAULT_MAX_CONNECTIONS = 100
 DEFAULT_CONNECTION_TIMEOUT = 20.0
+DEFAULT_VALIDATION_INTERVAL = 3.0
 DEFAULT_SERVER_SELECTION_TIMEOUT = 30.0
 DEFAULT_SOCKET_TIMEOUT = None
 
@@ -1,11 +1,84 @@
 """Cursor Objects for MongoDB"""
 
+import itertools
+import queue
+import threading
+import warnings
+
 from typing import Any, Iterator, Optional
 from collections.abc import Sequence
 
+from .constants import DEFAULT_BATCH_SIZE
 from .exceptions import InterfaceError, ProgrammingError
 from .document_factory import DocumentFactory, document_factory, dict_factory
 
+# Operation name -> pymongo Collection method. A dict lookup replaces the
+# old if/elif ladder and new operations only need an entry here
+_OP_TABLE = {
+    "find": "find",
+    "find_one": "find_one",
+    "insert_one": "insert_one",
+    "insert_many": "insert_many",
+    "update_one": "update_one",
+    "update_many": "update_many",
+    "delete_one": "delete_one",
+    "delete_many": "delete_many",
+    "replace_one": "replace_one",
+    "aggregate": "aggregate",
+    "count_documents": "count_documents",
+    "estimated_document_count": "estimated_document_count",
+}
+
+
+def _sort_fields_survive(projection: dict, sort_fields) -> bool:
+    """Check whether every sort field is still present after projection"""
+    names = set(projection)
+    non_id = [name for name in names if name != "_id"]
+    inclusion = (
+        any(projection[name] for name in non_id) if non_id
+        else bool(projection.get("_id"))
+    )
+    for field in sort_fields:
+        parts = field.split(".")
+        prefixes = {".".join(parts[:n]) for n in range(1, len(parts) + 1)}
+        listed = bool(prefixes & names)
+        if listed != inclusion:
+            return False
+    return True
+
+
+def _optimize_pipeline(pipeline: list[dict]) -> list[dict]:
+    """Move a plain $project past an adjacent $sort (and $limit).
+
+    A $project between $match and $sort forces the server to sort
+    materialized documents instead of running an index-backed top-K scan.
+    When the projection is a simple include/exclude spec that keeps the
+    sort fields, deferring it past $sort/$limit is semantically identical
+    and preserves the index plan. Computed or renaming projections are
+    left alone.
+    """
+    out = pipeline
+    i = 0
+    while i < len(out) - 1:
+        stage = out[i]
+        nxt = out[i + 1]
+        if "$project" in stage and "$sort" in nxt:
+            projection = stage["$project"]
+            if all(isinstance(v, (bool, int)) for v in projection.values()):
+                if _sort_fields_survive(projection, nxt["$sort"]):
+                    j = i + 2
+                    if j < len(out) and "$limit" in out[j]:
+                        j += 1
+                    out = out[:i] + out[i + 1:j] + [stage] + out[j:]
+                    i = j
+                    continue
+                warnings.warn(
+                    "$project before $sort strips the sort field(s); "
+                    "the sort cannot use an index and may be on missing fields"
+                )
+        i += 1
+    return out
+
 
 class Cursor:
     """MongoDB cursor for query results"""
@@ -31,11 +104,40 @@ class Cursor:
         self._connection = connection
         self._collection_name = collection
         self._operation = operation
+
+        # Field selection fast path: "only" narrows documents server-side,
+        # so fewer bytes cross the socket and less BSON gets decoded
+        only = kwargs.pop("only", None)
+        if only:
+            projection = {field: 1 for field in only}
+            if "_id" not in projection:
+                projection["_id"] = 0
+            if operation == "aggregate" and args:
+                args = ([{"$project": projection}, *args[0]],) + args[1:]
+            else:
+                kwargs["projection"] = projection
+
+        # Server batch size: larger batches mean fewer getMore round trips
+        # when draining big result sets (find and aggregate only; other
+        # operations never page)
+        self._batch_size = kwargs.pop("batch_size", DEFAULT_BATCH_SIZE)
+        optimize = kwargs.pop("optimize_pipeline", True)
+        if operation == "aggregate":
+            if self._batch_size:
+                kwargs.setdefault("batchSize", self._batch_size)
+            if "allow_disk_use" in kwargs:
+                kwargs["allowDiskUse"] = kwargs.pop("allow_disk_use")
+            if optimize and args:
+                args = (_optimize_pipeline(list(args[0])),) + args[1:]
+
         self._args = args
         self._kwargs = kwargs
         self._document_factory: DocumentFactory = (
             connection._document_factory or dict_factory
         )
+        # The default factory returns the raw dict unchanged; skip the
+        # per-row call entirely on that path
+        self._apply_factory = self._document_factory is not dict_factory
         self._result = None
         self._executed = False
         self._description = None
@@ -51,31 +153,25 @@ class Cursor:
         try:
             collection = self._connection.collection(self._collection_name)
 
+            # Run inside an enclosing transaction's session unless the
+            # caller passed one (estimated_document_count is sessionless)
+            if "session" not in self._kwargs:
+                session = self._connection._active_session
+                if session is not None and self._operation != "estimated_document_count":
+                    self._kwargs["session"] = session
+
+            method_name = _OP_TABLE.get(self._operation)
+            if method_name is None:
+                raise ProgrammingError(f"Unknown operation: {self._operation}")
+
+            self._result = getattr(collection, method_name)(
+                *self._args, **self._kwargs
+            )
+
             if self._operation == "find":
-                self._result = collection.find(*self._args, **self._kwargs)
+                if self._batch_size:
+                    self._result = self._result.batch_size(self._batch_size)
                 self._description = None  # MongoDB doesn't have fixed schema
-            elif self._operation == "find_one":
-                self._result = collection.find_one(*self._args, **self._kwargs)
-            elif self._operation == "insert_one":
-                self._result = collection.insert_one(*self._args, **self._kwargs)
-            elif self._operation == "insert_many":
-                self._result = collection.insert_many(*self._args, **self._kwargs)
-            elif self._operation == "update_one":
-                self._result = collection.update_one(*self._args, **self._kwargs)
-            elif self._operation == "update_many":
-                self._result = collection.update_many(*self._args, **self._kwargs)
-            elif self._operation == "delete_one":
-                self._result = collection.delete_one(*self._args, **self._kwargs)
-            elif self._operation == "delete_many":
-                self._result = collection.delete_many(*self._args, **self._kwargs)
-            elif self._operation == "replace_one":
-                self._result = collection.replace_one(*self._args, **self._kwargs)
-            elif self._operation == "aggregate":
-                self._result = collection.aggregate(*self._args, **self._kwargs)
-            elif self._operation == "count_documents":
-                self._result = collection.count_documents(*self._args, **self._kwargs)
-            else:
-                raise ProgrammingError(f"Unknown operation: {self._operation}")
 
             self._executed = True
         except Exception as e:
@@ -92,14 +188,14 @@ class Cursor:
             doc = self._result
             if doc is None:
                 return None
-            return self._document_factory(self, doc)
+            return self._document_factory(self, doc) if self._apply_factory else doc
 
         if self._operation == "find":
             if self._result is None:
                 return None
             try:
                 doc = next(self._result)
-                return self._document_factory(self, doc)
+                return self._document_factory(self, doc) if self._apply_factory else doc
             except StopIteration:
                 return None
 
@@ -114,14 +210,11 @@ class Cursor:
         if self._operation == "find":
             if self._result is None:
                 return []
-            docs = []
-            try:
-                for _ in range(size):
-                    doc = next(self._result)
-                    docs.append(self._document_factory(self, doc))
-            except StopIteration:
-                pass
-            return docs
+            chunk = itertools.islice(self._result, size)
+            if not self._apply_factory:
+                return list(chunk)
+            factory = self._document_factory
+            return [factory(self, doc) for doc in chunk]
 
         if self._operation == "find_one":
             doc = self.fetchone()
@@ -129,18 +222,89 @@ class Cursor:
 
         return []
 
+    def fetch_batches(self, size: int | None = None) -> Iterator[list[dict]]:
+        """Yield documents in lists of up to size (default: batch_size).
+
+        Lets callers overlap processing of one chunk with fetching the
+        next, instead of materializing everything like fetchall().
+        """
+        if not self._executed:
+            self.execute()
+
+        if self._operation != "find" or self._result is None:
+            batch = self.fetchall()
+            if batch:
+                yield batch
+            return
+
+        size = size or self._batch_size or DEFAULT_BATCH_SIZE
+        factory = self._document_factory if self._apply_factory else None
+        while True:
+            chunk = itertools.islice(self._result, size)
+            if factory is not None:
+                batch = [factory(self, doc) for doc in chunk]
+            else:
+                batch = list(chunk)
+            if not batch:
+                return
+            yield batch
+
+    def iter_prefetched(self, maxsize: int | None = None) -> Iterator[dict]:
+        """Iterate while a background thread prefetches raw documents.
+
+        A daemon thread drains the driver cursor into a bounded queue so
+        socket waits for the next server batch overlap with document
+        construction on the consuming thread. maxsize bounds the queue
+        (default: twice the batch size).
+        """
+        if not self._executed:
+            self.execute()
+
+        if self._operation != "find" or self._result is None:
+            yield from self
+            return
+
+        buffer: queue.Queue = queue.Queue(
+            maxsize=maxsize or 2 * (self._batch_size or DEFAULT_BATCH_SIZE)
+        )
+        sentinel = object()
+        error: list[BaseException] = []
+
+        def _prefetch():
+            try:
+                for doc in self._result:
+                    buffer.put(doc)
+            except BaseException as e:
+                error.append(e)
+            finally:
+                buffer.put(sentinel)
+
+        threading.Thread(target=_prefetch, daemon=True).start()
+
+        factory = self._document_factory if self._apply_factory else None
+        while True:
+            doc = buffer.get()
+            if doc is sentinel:
+                if error:
+                    raise ProgrammingError(f"Operation failed: {error[0]}")
+                return
+            yield factory(self, doc) if factory is not None else doc
+
     def fetchall(self) -> list[dict]:
-        """Fetch all documents"""
+        """Fetch all documents (eager; see fetch_batches for streaming)"""
         if not self._executed:
             self.execute()
 
         if self._operation == "find":
             if self._result is None:
                 return []
-            return [
-                self._document_factory(self, doc)
-                for doc in self._result
-            ]
+            if not self._apply_factory:
+                # list(iter) drains the cursor in one C-level call
+                return list(self._result)
+            # Hoist the factory into a local: the comprehension then does a
+            # LOAD_FAST per row instead of an attribute lookup
+            factory = self._document_factory
+            return [factory(self, doc) for doc in self._result]
 
         if self._operation == "find_one":
             doc = self.fetchone()
@@ -156,8 +320,12 @@ class Cursor:
         if self._operation == "find":
             if self._result is None:
                 return
+            if not self._apply_factory:
+                yield from self._result
+                return
+            factory = self._document_factory
             for doc in self._result:
-                yield self._document_factory(self, doc)
+                yield factory(self, doc)
         elif self._operation == "find_one":
             doc = self.fetchone()
             if doc is not None:
@@ -179,7 +347,7 @@ class Cursor:
     def rowcount(self) -> int:
         """Return number of affected rows (for write operations)"""
         if not self._executed:
-            return -1
+            self.execute()
 
         if self._operation in ("insert_one", "update_one", "delete_one", "replace_one"):
             return 1 if self._result.acknowledged else 0
@@ -189,7 +357,7 @@ class Cursor:
                     self._result.deleted_count if hasattr(self._result, 'deleted_count') else 0
                 )
             )
-        elif self._operation == "count_documents":
+        elif self._operation in ("count_documents", "estimated_document_count"):
             return self._result
 
         return -1
@@ -197,5 +365,7 @@ class Cursor:
     @property
     def result(self) -> Any:
         """Get the raw result object"""
+        if not self._executed:
+            self.execute()
         return self._result
 
@@ -6,9 +6,14 @@ from typing import Any, Mapping
 class Document(Mapping):
     """A document from a MongoDB query result"""
 
+    # No per-instance __dict__: large result sets allocate one Document
+    # per row, and three slot references beat a dict per instance
+    __slots__ = ("_cursor", "_data", "_hash")
+
     def __init__(self, cursor: 'Cursor', data: dict):
         self._cursor = cursor
         self._data = data
+        self._hash: int | None = None
 
     def __getitem__(self, key: str) -> Any:
         """Get item by key"""
@@ -25,14 +30,23 @@ class Document(Mapping):
     def __eq__(self, other) -> bool:
         """Compare documents"""
         if isinstance(other, Document):
-            return self._data == other._data
-        if isinstance(other, dict):
-            return self._data == other
-        return False
+            other = other._data
+        elif not isinstance(other, dict):
+            return False
+        # Cheap size check before the O(n) dict comparison
+        if len(self._data) != len(other):
+            return False
+        return self._data == other
 
     def __hash__(self) -> int:
-        """Hash the document"""
-        return hash(tuple(sorted(self._data.items())))
+        """Hash the document (cached; order-independent via frozenset)"""
+        if self._hash is None:
+            try:
+                self._hash = hash(frozenset(self._data.items()))
+            except TypeError:
+                # Unhashable value somewhere in the document
+                self._hash = id(self)
+        return self._hash
 
     def __repr__(self) -> str:
         """String representation"""
@@ -15,10 +15,17 @@ class DocumentFactory(Protocol):
         ...
 
 
+# Resolved on first use; re-running the import statement per row costs a
+# sys.modules lookup for every document in a result set
+_Document: type | None = None
+
+
 def document_factory(cursor: 'Cursor', document: dict) -> 'Document':
     """Default document factory that returns Document objects"""
-    from .document import Document
-    return Document(cursor, document)
+    global _Document
+    if _Document is None:
+        from .document import Document as _Document
+    return _Document(cursor, document)
 
 
 def dict_factory(cursor: 'Cursor', document: dict) -> dict:
@@ -5,16 +5,36 @@ class NamedTupleFactory:
     def __init__(self, name: str = "Document"):
         self.name = name
         self._cache: dict[tuple, type] = {}
+        self._last_fields: tuple | None = None
+        self._last_class: type | None = None
 
     def __call__(self, cursor: 'Cursor', document: dict) -> tuple:
         """Create a named tuple from document"""
         if not document:
             return tuple()
 
-        field_names = tuple(sorted(document.keys()))
+        # Insertion order (stable across a same-schema cursor) instead of
+        # sorting per row; same-shaped documents hit the caches below
+        field_names = tuple(document.keys())
 
-        if field_names not in self._cache:
+        # Fast path: rows from one cursor usually share a schema, so the
+        # class from the previous row can be reused without a dict lookup
+        if cursor is not None and getattr(cursor, "_nt_fields", None) == field_names:
+            return cursor._nt_class._make(document.values())
+        if field_names == self._last_fields:
+            return self._last_class._make(document.values())
+
+        nt_class = self._cache.get(field_names)
+        if nt_class is None:
             from collections import namedtuple
-            self._cache[field_names] = namedtuple(self.name, field_names)
+            nt_class = namedtuple(self.name, field_names)
+            self._cache[field_names] = nt_class
+
+        if cursor is not None:
+            cursor._nt_fields = field_names
+            cursor._nt_class = nt_class
+        self._last_fields = field_names
+        self._last_class = nt_class
 
-        return self._cache[field_names](*[document[key] for key in field_names])
+        # _make consumes values() in one C-level pass - no per-key lookups
+        return nt_class._make(document.values())
@@ -1,4 +1,5 @@
 """Type Adapters and Converters for MongoDB"""
+import sys
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Any, Callable
@@ -8,60 +9,120 @@ from bson import ObjectId, Decimal128
 
 from .exceptions import ProgrammingError
 
+# Types the driver serializes as-is; values of exactly these classes skip
+# adapter dispatch entirely
+_NATIVE_SET = frozenset({datetime, ObjectId, int, float, str, bool, bytes})
+
+# fromisoformat accepts a space date/time separator from 3.11 on; older
+# interpreters need the 'T' rewritten first
+_ISO_ACCEPTS_SPACE = sys.version_info >= (3, 11)
+
 
 class TypeRegistry:
-    """Registry for type adapters and converters"""
+    """Registry for type adapters and converters.
+
+    Instantiated once as the module-level registry; slots keep attribute
+    access on the hot adapt/convert paths a fixed offset instead of a
+    class-dict lookup.
+    """
 
-    _adapters: dict[type, Callable] = {}
-    _converters: dict[str, Callable] = {}
+    __slots__ = ("_adapters", "_converters", "_type_cache", "_compiled_adapters")
 
-    @classmethod
-    def register_adapter(cls, type_: type, adapter: Callable) -> None:
+    def __init__(self):
+        self._adapters: dict[type, Callable] = {}
+        self._converters: dict[str, Callable] = {}
+        # Resolved type -> adapter (or None), so the subclass walk below
+        # runs at most once per concrete type
+        self._type_cache: dict[type, Callable | None] = {}
+        # Schema -> compiled per-document adapter (see compile_adapter)
+        self._compiled_adapters: dict[frozenset, Callable] = {}
+
+    def register_adapter(self, type_: type, adapter: Callable) -> None:
         """Register an adapter for a Python type"""
-        cls._adapters[type_] = adapter
+        self._adapters[type_] = adapter
+        self._type_cache.clear()
+        self._compiled_adapters.clear()
 
-    @classmethod
-    def register_converter(cls, typename: str, converter: Callable) -> None:
+    def register_converter(self, typename: str, converter: Callable) -> None:
         """Register a converter for a MongoDB/BSON type"""
-        cls._converters[typename.upper()] = converter
+        self._converters[sys.intern(typename.upper())] = converter
 
-    @classmethod
-    def get_adapter(cls, type_: type) -> Callable | None:
+    def get_adapter(self, type_: type) -> Callable | None:
         """Get adapter for a type"""
-        # Check exact type match first
-        if type_ in cls._adapters:
-            return cls._adapters[type_]
-
-        # Check for subclass matches
-        for registered_type, adapter in cls._adapters.items():
-            if issubclass(type_, registered_type):
-                return adapter
-
-        return None
-
-    @classmethod
-    def get_converter(cls, typename: str) -> Callable | None:
+        try:
+            return self._type_cache[type_]
+        except KeyError:
+            pass
+
+        # Check exact type match first, then subclass matches
+        adapter = self._adapters.get(type_)
+        if adapter is None:
+            for registered_type, candidate in self._adapters.items():
+                if issubclass(type_, registered_type):
+                    adapter = candidate
+                    break
+
+        self._type_cache[type_] = adapter
+        return adapter
+
+    def get_converter(self, typename: str) -> Callable | None:
         """Get converter for a typename"""
-        return cls._converters.get(typename.upper())
-
-    @classmethod
-    def adapt(cls, value: Any) -> Any:
+        # Callers usually pass the canonical uppercase name already; try
+        # it as-is before paying for an .upper() allocation
+        converter = self._converters.get(typename)
+        if converter is not None:
+            return converter
+        return self._converters.get(typename.upper())
+
+    def adapt(self, value: Any) -> Any:
         """Adapt a Python value to MongoDB/BSON"""
         if value is None:
             return None
 
         value_type = type(value)
-        adapter = cls.get_adapter(value_type)
+        if value_type in _NATIVE_SET:
+            return value
+
+        adapter = self.get_adapter(value_type)
 
         if adapter:
             return adapter(value)
 
         return value
 
-    @classmethod
-    def convert(cls, typename: str, value: Any) -> Any:
+    def compile_adapter(self, schema: dict[str, type]) -> Callable[[dict], dict]:
+        """Compile a per-document adapter for a fixed field schema.
+
+        Generic adapt() pays a dispatch per field per document. For bulk
+        inserts of homogeneous documents, this generates one function
+        whose body is a single dict display with the exact adapter call
+        (or a plain key copy for native types) inlined per field, and
+        caches it by schema. Apply it per document instead of adapt().
+        """
+        key = frozenset(schema.items())
+        adapt_doc = self._compiled_adapters.get(key)
+        if adapt_doc is not None:
+            return adapt_doc
+
+        namespace: dict[str, Any] = {}
+        parts = []
+        for i, (field, type_) in enumerate(schema.items()):
+            adapter = None if type_ in _NATIVE_SET else self.get_adapter(type_)
+            if adapter is None:
+                parts.append(f"{field!r}: d[{field!r}]")
+            else:
+                namespace[f"_a{i}"] = adapter
+                parts.append(f"{field!r}: _a{i}(d[{field!r}])")
+
+        source = "def _adapt(d):\n    return {" + ", ".join(parts) + "}"
+        exec(source, namespace)
+        adapt_doc = namespace["_adapt"]
+        self._compiled_adapters[key] = adapt_doc
+        return adapt_doc
+
+    def convert(self, typename: str, value: Any) -> Any:
         """Convert a MongoDB/BSON value to Python"""
-        converter = cls.get_converter(typename)
+        converter = self.get_converter(typename)
         if converter:
             return converter(value)
         return value
@@ -80,7 +141,9 @@ def adapt_date(val: date) -> datetime:
 
 def adapt_decimal(val: Decimal) -> Decimal128:
     """Adapt Decimal to Decimal128"""
-    return Decimal128(str(val))
+    # Decimal128 takes a Decimal directly; going through str() would pay
+    # a format plus a re-parse per value
+    return Decimal128(val)
 
 
 def adapt_uuid(val: UUID) -> str:
@@ -88,80 +151,123 @@ def adapt_uuid(val: UUID) -> str:
     return str(val)
 
 
-def adapt_objectid(val: ObjectId) -> ObjectId:
-    """Adapt ObjectId (MongoDB handles ObjectId natively)"""
-    return val
-
-
-# Default converters
+# Default converters. Each starts with an exact type() check: for the
+# overwhelmingly common case (the driver already decoded the right
+# class) that's a pointer compare, cheaper than isinstance's subclass
+# walk, which stays as the fallback.
 def convert_datetime(val: Any) -> datetime:
     """Convert MongoDB datetime to Python datetime"""
-    if isinstance(val, datetime):
+    if type(val) is datetime or isinstance(val, datetime):
         return val
     if isinstance(val, str):
-        return datetime.fromisoformat(val.replace(' ', 'T', 1))
+        if not _ISO_ACCEPTS_SPACE and len(val) > 10 and val[10] == ' ':
+            val = val[:10] + 'T' + val[11:]
+        return datetime.fromisoformat(val)
     raise ProgrammingError(f"Cannot convert {type(val)} to datetime")
 
 
 def convert_date(val: Any) -> date:
     """Convert MongoDB datetime to Python date"""
-    if isinstance(val, datetime):
+    if type(val) is datetime or isinstance(val, datetime):
         return val.date()
     if isinstance(val, date):
         return val
     if isinstance(val, str):
-        return datetime.fromisoformat(val.replace(' ', 'T', 1)).date()
+        if not _ISO_ACCEPTS_SPACE and len(val) > 10 and val[10] == ' ':
+            val = val[:10] + 'T' + val[11:]
+        return datetime.fromisoformat(val).date()
     raise ProgrammingError(f"Cannot convert {type(val)} to date")
 
 
 def convert_decimal(val: Any) -> Decimal:
     """Convert MongoDB Decimal128 to Decimal"""
-    if isinstance(val, Decimal128):
-        return Decimal(str(val))
+    if type(val) is Decimal128 or isinstance(val, Decimal128):
+        return val.to_decimal()
     if isinstance(val, Decimal):
         return val
     return Decimal(str(val))
 
 
 def convert_uuid(val: Any) -> UUID:
-    """Convert MongoDB string to Python UUID"""
-    if isinstance(val, UUID):
+    """Convert MongoDB string or binary UUID to Python UUID"""
+    if type(val) is UUID or isinstance(val, UUID):
         return val
+    # BSON binary subtype 4 arrives as 16 raw bytes; constructing from
+    # them is a copy, versus stringify + re-parse of 36 ASCII chars
+    if isinstance(val, (bytes, bytearray)) and len(val) == 16:
+        return UUID(bytes=bytes(val))
     return UUID(str(val))
 
 
 def convert_objectid(val: Any) -> ObjectId:
     """Convert to ObjectId"""
-    if isinstance(val, ObjectId):
+    if type(val) is ObjectId or isinstance(val, ObjectId):
         return val
     if isinstance(val, str):
         return ObjectId(val)
     raise ProgrammingError(f"Cannot convert {type(val)} to ObjectId")
 
 
-# Registration functions
-def register_adapter(type_: type, adapter: Callable) -> None:
-    """Register an adapter for a Python type"""
-    TypeRegistry.register_adapter(type_, adapter)
-
-
-def register_converter(typename: str, converter: Callable) -> None:
-    """Register a converter for a MongoDB/BSON type"""
-    TypeRegistry.register_converter(typename, converter)
-
-
-# Register default adapters
-TypeRegistry.register_adapter(datetime, adapt_datetime)
-TypeRegistry.register_adapter(date, adapt_date)
-TypeRegistry.register_adapter(Decimal, adapt_decimal)
-TypeRegistry.register_adapter(UUID, adapt_uuid)
-TypeRegistry.register_adapter(ObjectId, adapt_objectid)
-
-# Register default converters
-TypeRegistry.register_converter("DATETIME", convert_datetime)
-TypeRegistry.register_converter("DATE", convert_date)
-TypeRegistry.register_converter("DECIMAL128", convert_decimal)
-TypeRegistry.register_converter("DECIMAL", convert_decimal)
-TypeRegistry.register_converter("UUID", convert_uuid)
-TypeRegistry.register_converter("OBJECTID", convert_objectid)
-TypeRegistry.register_converter("OID", convert_objectid)
+# The process-wide registry; module-level helpers are bound methods so
+# callers keep the functional API
+registry = TypeRegistry()
+
+register_adapter = registry.register_adapter
+register_converter = registry.register_converter
+get_adapter = registry.get_adapter
+get_converter = registry.get_converter
+compile_adapter = registry.compile_adapter
+
+
+# Free-function adapt/convert for the per-field hot path. Default args
+# bind the registry's tables at definition time, so each call does
+# LOAD_FASTs instead of global + attribute lookups; the registry only
+# ever mutates these dicts in place, never rebinds them, so the bound
+# references stay live across register_* calls.
+def adapt(
+        value: Any,
+        _native=_NATIVE_SET,
+        _cache=registry._type_cache,
+        _get_adapter=registry.get_adapter,
+) -> Any:
+    """Adapt a Python value to MongoDB/BSON"""
+    if value is None:
+        return None
+    value_type = type(value)
+    if value_type in _native:
+        return value
+    adapter = _cache.get(value_type)
+    if adapter is None:
+        adapter = _get_adapter(value_type)
+    return adapter(value) if adapter else value
+
+
+def convert(typename: str, value: Any, _converters=registry._converters) -> Any:
+    """Convert a MongoDB/BSON value to Python"""
+    converter = _converters.get(typename)
+    if converter is None:
+        converter = _converters.get(typename.upper())
+    return converter(value) if converter else value
+
+# Default registrations, written as single dict updates rather than one
+# register_* call each: a dozen fewer function calls on cold import.
+# Exact datetime/ObjectId values never reach dispatch (native fast path
+# above); adapt_datetime stays registered so datetime *subclasses*
+# resolve to identity rather than the date adapter. Converter keys are
+# the canonical uppercase forms register_converter would produce, and
+# string literals are interned by the compiler already.
+registry._adapters.update({
+    datetime: adapt_datetime,
+    date: adapt_date,
+    Decimal: adapt_decimal,
+    UUID: adapt_uuid,
+})
+registry._converters.update({
+    "DATETIME": convert_datetime,
+    "DATE": convert_date,
+    "DECIMAL128": convert_decimal,
+    "DECIMAL": convert_decimal,
+    "UUID": convert_uuid,
+    "OBJECTID": convert_objectid,
+    "OID": convert_objectid,
+})
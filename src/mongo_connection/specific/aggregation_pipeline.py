@@ -3,6 +3,12 @@
 from ..core.connection import Connection
 from ..core.cursor import Cursor
 
+# Interned constant stages: pipelines built in loops reuse one frozen dict
+# for repeated values like .limit(100) instead of allocating per call
+_LIMIT_CACHE: dict[int, dict] = {}
+_SKIP_CACHE: dict[int, dict] = {}
+_STAGE_CACHE_MAX = 1024
+
 
 class AggregationPipeline:
     """Builder for MongoDB aggregation pipelines"""
@@ -34,12 +40,22 @@ class AggregationPipeline:
 
     def limit(self, limit: int) -> 'AggregationPipeline':
         """Add $limit stage"""
-        self._pipeline.append({"$limit": limit})
+        stage = _LIMIT_CACHE.get(limit)
+        if stage is None:
+            stage = {"$limit": limit}
+            if len(_LIMIT_CACHE) < _STAGE_CACHE_MAX:
+                _LIMIT_CACHE[limit] = stage
+        self._pipeline.append(stage)
         return self
 
     def skip(self, skip: int) -> 'AggregationPipeline':
         """Add $skip stage"""
-        self._pipeline.append({"$skip": skip})
+        stage = _SKIP_CACHE.get(skip)
+        if stage is None:
+            stage = {"$skip": skip}
+            if len(_SKIP_CACHE) < _STAGE_CACHE_MAX:
+                _SKIP_CACHE[skip] = stage
+        self._pipeline.append(stage)
         return self
 
     def unwind(self, path: str, **options) -> 'AggregationPipeline':
@@ -92,9 +108,9 @@ class AggregationPipeline:
         self._pipeline.append({"$sample": {"size": size}})
         return self
 
-    def build(self) -> list[dict]:
-        """Build the aggregation pipeline"""
-        return self._pipeline.copy()
+    def build(self) -> tuple[dict, ...]:
+        """Build the aggregation pipeline (immutable snapshot of the stages)"""
+        return tuple(self._pipeline)
 
     def execute(self) -> Cursor:
         """Execute the aggregation pipeline"""
@@ -103,9 +119,15 @@ class AggregationPipeline:
             "aggregate",
             self._pipeline
         )
-        cursor.execute()
         return cursor
 
+    async def aaggregate(self) -> list[dict]:
+        """Execute the pipeline asynchronously (requires an AsyncConnection)"""
+        cursor = self._conn.collection(self._collection).aggregate(
+            self._pipeline
+        )
+        return await cursor.to_list(length=None)
+
     def fetchall(self) -> list[dict]:
         """Execute and fetch all results"""
         return list(self.execute())
@@ -1,11 +1,41 @@
 """MongoDB Change Streams Support"""
 
+import asyncio
+import logging
+import queue
 import threading
 from typing import Callable, Optional
 
+from ..core.async_connection import AsyncConnection
 from ..core.connection import Connection
 from ..core.exceptions import OperationalError
 
+# One shared event loop on a daemon thread hosts every async listener:
+# hundreds of change streams multiplex onto a single thread instead of
+# one blocking thread per stream
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+logger = logging.getLogger(__name__)
+
+
+# Flush a pending batch once it reaches this many changes
+_BATCH_FLUSH_SIZE = 64
+# How long to sleep when the stream is idle before polling again
+_IDLE_WAIT = 0.1
+
+
+def _listener_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the shared background event loop"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            _LOOP = loop
+    return _LOOP
+
 
 class ChangeStreamListener:
     """Listener for MongoDB change stream events"""
@@ -17,30 +47,49 @@ class ChangeStreamListener:
         self._database: str | None = None
         self._pipeline: list[dict] | None = None
         self._callback: Optional[Callable] = None
+        self._batch_callback: Optional[Callable] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._change_stream = None
+        self._task = None
+        self._queue: queue.SimpleQueue | None = None
 
     def watch(
             self,
             collection: str | None = None,
             database: str | None = None,
             pipeline: list[dict] | None = None,
-            callback: Optional[Callable] = None
+            callback: Optional[Callable] = None,
+            batch_callback: Optional[Callable] = None,
+            queue_mode: bool = False
     ) -> None:
         """
         Watch for changes.
-        
+
         Args:
             collection: Collection name to watch (None for database-level)
             database: Database name to watch (None for cluster-level)
             pipeline: Aggregation pipeline to filter changes
             callback: Callback function(change_document)
+            batch_callback: Callback function(list_of_changes); on bursty
+                streams one call per batch replaces one per event
+            queue_mode: Deliver changes into a SimpleQueue (see the queue
+                property) instead of a callback; the consumer drains at
+                its own pace on its own thread
         """
         self._collection = collection
         self._database = database
         self._pipeline = pipeline
+        if queue_mode:
+            self._queue = queue.SimpleQueue()
+            callback = self._queue.put
         self._callback = callback
+        self._batch_callback = batch_callback
+
+    @property
+    def queue(self) -> queue.SimpleQueue | None:
+        """The delivery queue when watching with queue_mode=True"""
+        return self._queue
 
     def start(self) -> None:
         """Start the change stream listener"""
@@ -49,7 +98,16 @@ class ChangeStreamListener:
         
         if not self._conn or self._conn.closed:
             raise OperationalError("Connection is closed")
-        
+
+        # Async (motor) connections run on the shared event loop instead
+        # of tying up an OS thread per stream
+        if isinstance(self._conn, AsyncConnection):
+            self._listening = True
+            self._task = asyncio.run_coroutine_threadsafe(
+                self._alisten(), _listener_loop()
+            )
+            return
+
         try:
             # Get the target (collection, database, or client)
             if self._collection:
@@ -79,7 +137,13 @@ class ChangeStreamListener:
         
         self._listening = False
         self._stop_event.set()
-        
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._change_stream = None
+            return
+
         if self._change_stream:
             try:
                 self._change_stream.close()
@@ -88,26 +152,78 @@ class ChangeStreamListener:
             self._change_stream = None
         
         if self._thread:
-            self._thread.join(timeout=1.0)
+            # The loop wakes on the stop event (or the closed stream), so
+            # a short join suffices; don't make shutdown pay a long tail
+            self._thread.join(timeout=_IDLE_WAIT)
+
+    async def _alisten(self) -> None:
+        """Async listening loop for motor change streams"""
+        if self._collection:
+            target = self._conn.collection(self._collection)
+        elif self._database:
+            target = self._conn.client[self._database]
+        else:
+            target = self._conn.client
+
+        stream = target.watch(self._pipeline) if self._pipeline else target.watch()
+        self._change_stream = stream
+        try:
+            async for change in stream:
+                if not self._listening:
+                    break
+                handler = self._callback
+                if handler is None and self._batch_callback:
+                    result = self._batch_callback([change])
+                elif handler:
+                    result = self._callback(change)
+                else:
+                    continue
+                if asyncio.iscoroutine(result):
+                    await result
+        finally:
+            await stream.close()
+            self._listening = False
 
     def _listen_loop(self) -> None:
         """Main listening loop"""
+        batch: list = []
         try:
             while self._listening and not self._stop_event.is_set():
                 try:
-                    if self._change_stream:
-                        # Get next change (with timeout)
-                        change = self._change_stream.next()
-                        if change and self._callback:
-                            self._callback(change)
+                    if not self._change_stream:
+                        break
+                    # Non-blocking: drain whatever the stream has buffered
+                    # and only sleep when it runs dry
+                    change = self._change_stream.try_next()
+                    if change is None:
+                        if batch:
+                            self._batch_callback(batch)
+                            batch = []
+                        self._stop_event.wait(_IDLE_WAIT)
+                        continue
+
+                    if self._batch_callback:
+                        batch.append(change)
+                        if len(batch) >= _BATCH_FLUSH_SIZE:
+                            self._batch_callback(batch)
+                            batch = []
+                    elif self._callback:
+                        self._callback(change)
                 except StopIteration:
                     # Change stream ended
                     break
-                except Exception as e:
+                except Exception:
                     if self._listening:
-                        # Log error but continue
-                        print(f"Change stream error: {e}")
+                        # Log and continue; logging defers formatting and
+                        # I/O to the configured handlers instead of an
+                        # unconditional print per transient error
+                        logger.exception("Change stream error")
         finally:
+            if batch and self._batch_callback:
+                try:
+                    self._batch_callback(batch)
+                except Exception:
+                    pass
             self._listening = False
 
     def __enter__(self):
@@ -125,10 +241,14 @@ def create_listener(
         collection: str | None = None,
         database: str | None = None,
         pipeline: list[dict] | None = None,
-        callback: Optional[Callable] = None
+        callback: Optional[Callable] = None,
+        batch_callback: Optional[Callable] = None,
+        queue_mode: bool = False
 ) -> ChangeStreamListener:
     """Create a change stream listener"""
     listener = ChangeStreamListener(connection)
-    listener.watch(collection, database, pipeline, callback)
+    listener.watch(
+        collection, database, pipeline, callback, batch_callback, queue_mode
+    )
     return listener
 
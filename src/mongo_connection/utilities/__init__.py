@@ -0,0 +1,19 @@
+"""Utility helpers: URI parsing and the interactive CLI"""
+
+# PEP 562 lazy loading: URI-only callers don't pay for the CLI module
+# (pymongo write models, json serializer setup) and vice versa; each
+# submodule imports on first attribute access
+_CLI_ATTRS = frozenset({"MongoDBCLI", "main"})
+_URI_ATTRS = frozenset({"MongoDBURI", "parse_uri", "build_uri", "is_uri", "uri_to_dsn"})
+
+__all__ = sorted(_CLI_ATTRS | _URI_ATTRS)
+
+
+def __getattr__(name):
+    if name in _URI_ATTRS:
+        from . import uri
+        return getattr(uri, name)
+    if name in _CLI_ATTRS:
+        from . import cli
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,77 @@
 """Command-Line Interface for MongoDB"""
 
-import argparse
 import json
-from pprint import pprint
+import logging
+import sys
 
-from src.core.connection import connect
+try:
+    # C-implemented serializer; pprint walks every dict in pure Python
+    # to compute layout widths
+    import orjson
+except ImportError:
+    orjson = None
+
+import bson
+from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+from ..core.connection import connect
+
+# Script operation types that can fold into one insert_many/bulk_write
+# round trip when they run back-to-back against the same collection
+_BULK_OP_TYPES = frozenset({"insert_one", "update_one", "delete_one"})
+
+# Server batch size for find/aggregate cursors when --batch-size isn't
+# given; larger batches mean fewer getMore round trips while printing
+_DEFAULT_BATCH_SIZE = 1000
+
+# CLI arguments forwarded to connect() when set
+_CONN_KEYS = ("host", "port", "database", "username", "password")
+
+logger = logging.getLogger(__name__)
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _format_doc(doc: dict) -> str:
+        """Serialize a document for display (ObjectId/datetime via str)"""
+        return orjson.dumps(doc, option=_ORJSON_OPTS, default=str).decode()
+else:
+    def _format_doc(doc: dict) -> str:
+        """Serialize a document for display (ObjectId/datetime via str)"""
+        return json.dumps(doc, indent=2, default=str)
 
 
 class MongoDBCLI:
     """Interactive MongoDB command-line interface"""
 
-    def __init__(self, dsn: str | None = None, **kwargs):
+    def __init__(self, dsn: str | None = None, batch_size: int | None = None, **kwargs):
         self.dsn = dsn
+        self.batch_size = batch_size
         self.connection_kwargs = kwargs
         self.connection = None
         self.prompt = "mongodb> "
         self.continuation_prompt = "   ...> "
+        # Collection handles by name; execute_file can hit the same
+        # collection thousands of times, and this skips even the
+        # Connection-level method call per entry. Cleared on reconnect
+        # and on .use.
+        self._coll_cache: dict = {}
+        # Operation type -> bound handler; one hash lookup per script
+        # entry instead of walking an if/elif ladder of string compares
+        self._dispatch = {
+            "find": self._op_find,
+            "find_one": self._op_find_one,
+            "insert_one": self._op_insert_one,
+            "insert_many": self._op_insert_many,
+            "update_one": self._op_update_one,
+            "update_many": self._op_update_many,
+            "delete_one": self._op_delete_one,
+            "delete_many": self._op_delete_many,
+            "aggregate": self._op_aggregate,
+            "count": self._op_count,
+        }
 
     def connect(self) -> None:
         """Connect to database"""
@@ -24,6 +80,8 @@ class MongoDBCLI:
         else:
             self.connection = connect(**self.connection_kwargs)
 
+        self._coll_cache.clear()
+
         # Get database name for display
         db_name = self.connection_kwargs.get('database', 'test')
         print(f"Connected to MongoDB database: {db_name}")
@@ -40,8 +98,7 @@ class MongoDBCLI:
 
             # Execute operations
             if isinstance(data, list):
-                for op in data:
-                    self.execute_operation(op)
+                self._execute_script(data)
             elif isinstance(data, dict):
                 self.execute_operation(data)
 
@@ -49,108 +106,220 @@ class MongoDBCLI:
         except Exception as e:
             print(f"Error executing script: {e}")
 
+    def _execute_script(self, operations: list) -> None:
+        """Execute a list of operations, batching where possible.
+
+        Large scripts are dominated by network round trips when every
+        entry becomes its own command. Consecutive insert_one/update_one/
+        delete_one entries against the same collection are folded into a
+        single insert_many or bulk_write — one round trip per run instead
+        of one per operation. Reads and anything else fall through to
+        execute_operation unchanged.
+        """
+        i = 0
+        n = len(operations)
+        while i < n:
+            op = operations[i]
+            # Non-dict entries fall through to execute_operation, which
+            # reports them without raising
+            collection = op.get("collection") if isinstance(op, dict) else None
+            if collection and op.get("type") in _BULK_OP_TYPES:
+                j = i + 1
+                while (j < n
+                       and isinstance(operations[j], dict)
+                       and operations[j].get("type") in _BULK_OP_TYPES
+                       and operations[j].get("collection") == collection):
+                    j += 1
+                if j - i > 1:
+                    self._execute_bulk(collection, operations[i:j])
+                    i = j
+                    continue
+            self.execute_operation(op)
+            i += 1
+
+    def _execute_bulk(self, collection: str, run: list) -> None:
+        """Execute a run of write operations as one command"""
+        try:
+            coll = self._get_coll(collection)
+
+            if all(op["type"] == "insert_one" for op in run):
+                docs = [op.get("document", {}) for op in run]
+                # Same-shape runs (log entries, sensor rows) get encoded
+                # to BSON here, once per document; the driver then
+                # splices the raw bytes into the wire message instead of
+                # walking each dict again at write time. Mirrors the
+                # pre-encode path in Model.save_many.
+                if len(docs) > 1 and len({frozenset(d) for d in docs}) == 1:
+                    docs = [
+                        RawBSONDocument(bson.encode(
+                            d if "_id" in d else {"_id": ObjectId(), **d}
+                        ))
+                        for d in docs
+                    ]
+                coll.insert_many(docs, ordered=False)
+                # Count what we sent: the driver does not populate
+                # inserted_ids for RawBSONDocument payloads, and an
+                # unacknowledged-error batch would have raised above
+                print(f"Inserted {len(docs)} documents")
+                return
+
+            models = []
+            for op in run:
+                op_type = op["type"]
+                if op_type == "insert_one":
+                    models.append(InsertOne(op.get("document", {})))
+                elif op_type == "update_one":
+                    models.append(UpdateOne(
+                        op.get("filter", {}),
+                        op.get("update", {}),
+                        upsert=op.get("upsert", False)
+                    ))
+                else:
+                    models.append(DeleteOne(op.get("filter", {})))
+            result = coll.bulk_write(models, ordered=False)
+            print(
+                f"Bulk: inserted {result.inserted_count}, "
+                f"matched {result.matched_count}, "
+                f"modified {result.modified_count}, "
+                f"deleted {result.deleted_count}"
+            )
+        except Exception:
+            logger.exception("Bulk write failed on %r", collection)
+
     def execute_operation(self, operation: dict) -> None:
         """Execute a MongoDB operation"""
         if not self.connection:
             print("Not connected to database")
             return
 
-        try:
-            op_type = operation.get("type")
-            collection = operation.get("collection")
-
-            if not collection:
-                print("Error: Collection not specified")
-                return
-
-            coll = self.connection.collection(collection)
-
-            if op_type == "find":
-                filter = operation.get("filter", {})
-                projection = operation.get("projection")
-                limit = operation.get("limit")
-                skip = operation.get("skip")
-                sort = operation.get("sort")
-
-                cursor = coll.find(filter, projection)
-                if sort:
-                    cursor = cursor.sort(sort)
-                if skip:
-                    cursor = cursor.skip(skip)
-                if limit:
-                    cursor = cursor.limit(limit)
-
-                results = list(cursor)
-                self._print_results(results)
-
-            elif op_type == "find_one":
-                filter = operation.get("filter", {})
-                projection = operation.get("projection")
-                result = coll.find_one(filter, projection)
-                if result:
-                    self._print_results([result])
-                else:
-                    print("No document found")
-
-            elif op_type == "insert_one":
-                document = operation.get("document", {})
-                result = coll.insert_one(document)
-                print(f"Inserted document with _id: {result.inserted_id}")
-
-            elif op_type == "insert_many":
-                documents = operation.get("documents", [])
-                result = coll.insert_many(documents)
-                print(f"Inserted {len(result.inserted_ids)} documents")
-
-            elif op_type == "update_one":
-                filter = operation.get("filter", {})
-                update = operation.get("update", {})
-                upsert = operation.get("upsert", False)
-                result = coll.update_one(filter, update, upsert=upsert)
-                print(f"Matched: {result.matched_count}, Modified: {result.modified_count}")
-
-            elif op_type == "update_many":
-                filter = operation.get("filter", {})
-                update = operation.get("update", {})
-                upsert = operation.get("upsert", False)
-                result = coll.update_many(filter, update, upsert=upsert)
-                print(f"Matched: {result.matched_count}, Modified: {result.modified_count}")
-
-            elif op_type == "delete_one":
-                filter = operation.get("filter", {})
-                result = coll.delete_one(filter)
-                print(f"Deleted {result.deleted_count} document(s)")
-
-            elif op_type == "delete_many":
-                filter = operation.get("filter", {})
-                result = coll.delete_many(filter)
-                print(f"Deleted {result.deleted_count} document(s)")
-
-            elif op_type == "aggregate":
-                pipeline = operation.get("pipeline", [])
-                cursor = coll.aggregate(pipeline)
-                results = list(cursor)
-                self._print_results(results)
-
-            elif op_type == "count":
-                filter = operation.get("filter", {})
-                count = coll.count_documents(filter)
-                print(f"Count: {count}")
-
-            else:
-                print(f"Unknown operation type: {op_type}")
+        # raw_decode hands over whatever JSON value was typed; treat a
+        # pasted array as a script and reject bare scalars instead of
+        # letting .get blow up and take the REPL down with it
+        if isinstance(operation, list):
+            self._execute_script(operation)
+            return
+        if not isinstance(operation, dict):
+            print(f"Error: Expected a JSON object, got {type(operation).__name__}")
+            return
 
-        except Exception as e:
-            print(f"Error: {e}")
+        # Validate outside the try: bad input isn't an operational
+        # failure, and the guarded region stays just the driver call
+        collection = operation.get("collection")
+        if not collection:
+            print("Error: Collection not specified")
+            return
 
-    def _print_results(self, results: list) -> None:
-        """Print query results"""
-        if not results:
-            print("No results")
+        handler = self._dispatch.get(operation.get("type"))
+        if handler is None:
+            print(f"Unknown operation type: {operation.get('type')}")
             return
 
+        try:
+            handler(self._get_coll(collection), operation)
+        except Exception:
+            # logging, not print: no per-operation stdout flush in
+            # execute_file loops, and handlers get the configured level
+            logger.exception("Operation failed: %r", operation.get("type"))
+
+    def _get_coll(self, name: str):
+        """Collection handle by name, memoized per CLI instance"""
+        coll = self._coll_cache.get(name)
+        if coll is None:
+            coll = self.connection.collection(name)
+            self._coll_cache[name] = coll
+        return coll
+
+    def _op_find(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        projection = operation.get("projection")
+        limit = operation.get("limit")
+        skip = operation.get("skip")
+        sort = operation.get("sort")
+
+        cursor = coll.find(filter, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        # Stream straight off the cursor; list() would hold the whole
+        # result set in memory before the first line prints
+        cursor = cursor.batch_size(self.batch_size or _DEFAULT_BATCH_SIZE)
+        self._print_results(cursor)
+
+    def _op_find_one(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        projection = operation.get("projection")
+        result = coll.find_one(filter, projection)
+        if result:
+            self._print_results([result])
+        else:
+            print("No document found")
+
+    def _op_insert_one(self, coll, operation: dict) -> None:
+        document = operation.get("document", {})
+        result = coll.insert_one(document)
+        print(f"Inserted document with _id: {result.inserted_id}")
+
+    def _op_insert_many(self, coll, operation: dict) -> None:
+        documents = operation.get("documents", [])
+        result = coll.insert_many(documents)
+        print(f"Inserted {len(result.inserted_ids)} documents")
+
+    def _op_update_one(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        update = operation.get("update", {})
+        upsert = operation.get("upsert", False)
+        result = coll.update_one(filter, update, upsert=upsert)
+        print(f"Matched: {result.matched_count}, Modified: {result.modified_count}")
+
+    def _op_update_many(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        update = operation.get("update", {})
+        upsert = operation.get("upsert", False)
+        result = coll.update_many(filter, update, upsert=upsert)
+        print(f"Matched: {result.matched_count}, Modified: {result.modified_count}")
+
+    def _op_delete_one(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        result = coll.delete_one(filter)
+        print(f"Deleted {result.deleted_count} document(s)")
+
+    def _op_delete_many(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        result = coll.delete_many(filter)
+        print(f"Deleted {result.deleted_count} document(s)")
+
+    def _op_aggregate(self, coll, operation: dict) -> None:
+        pipeline = operation.get("pipeline", [])
+        cursor = coll.aggregate(
+            pipeline,
+            batchSize=self.batch_size or _DEFAULT_BATCH_SIZE
+        )
+        self._print_results(cursor)
+
+    def _op_count(self, coll, operation: dict) -> None:
+        filter = operation.get("filter", {})
+        count = coll.count_documents(filter)
+        print(f"Count: {count}")
+
+    def _print_results(self, results) -> None:
+        """Print query results from any iterable, one document at a time.
+
+        Documents print as they arrive off the wire, so network I/O for
+        the next server batch overlaps with formatting and peak memory
+        stays one document deep regardless of result size.
+        """
+        write = sys.stdout.write
+        empty = True
         for doc in results:
-            pprint(doc)
+            empty = False
+            write(_format_doc(doc))
+            write("\n")
+        if empty:
+            print("No results")
 
     def run_interactive(self) -> None:
         """Run interactive REPL"""
@@ -159,7 +328,12 @@ class MongoDBCLI:
         print("MongoDB Interactive Shell")
         print("Enter '.help' for help, '.quit' to exit")
 
-        buffer = []
+        # raw_decode stops at the first complete JSON value and reports
+        # how far it got, so an N-line operation is scanned once instead
+        # of json.loads re-parsing the whole buffer on every newline —
+        # and several operations pasted in one block all run
+        decoder = json.JSONDecoder()
+        buffer = ""
 
         try:
             while True:
@@ -178,24 +352,27 @@ class MongoDBCLI:
                         continue
 
                     # Accumulate JSON operation
-                    buffer.append(line)
-                    text = ' '.join(buffer)
-
-                    # Try to parse as JSON
-                    try:
-                        operation = json.loads(text)
+                    buffer = f"{buffer} {line}" if buffer else line
+
+                    while buffer:
+                        try:
+                            operation, end = decoder.raw_decode(buffer)
+                        except json.JSONDecodeError as e:
+                            if e.pos >= len(buffer):
+                                # Truncated value: keep accumulating
+                                break
+                            print(f"Invalid JSON: {e}")
+                            buffer = ""
+                            break
                         self.execute_operation(operation)
-                        buffer = []
-                    except json.JSONDecodeError:
-                        # Not complete JSON yet, continue
-                        pass
+                        buffer = buffer[end:].lstrip()
 
                 except EOFError:
                     print("\nExiting...")
                     break
                 except KeyboardInterrupt:
                     print("\nInterrupted. Type '.quit' to exit.")
-                    buffer = []
+                    buffer = ""
         finally:
             if self.connection:
                 self.connection.close()
@@ -229,8 +406,15 @@ Operations are specified as JSON:
         elif cmd == '.use' and len(parts) > 1:
             db_name = parts[1]
             self.connection_kwargs['database'] = db_name
-            self.connection.close()
-            self.connect()
+            if self.connection and not self.connection.closed:
+                # Rebind the database handle on the live client; a
+                # close()/connect() cycle would redo server selection
+                # and the auth handshake for nothing
+                self.connection.use_database(db_name)
+                self._coll_cache.clear()
+                print(f"Switched to database: {db_name}")
+            else:
+                self.connect()
         elif cmd == '.show' and len(parts) > 1:
             coll_name = parts[1]
             operation = {
@@ -247,6 +431,10 @@ Operations are specified as JSON:
 
 def main():
     """Main entry point for CLI"""
+    # Only the entry point needs argparse; importing it here keeps its
+    # ~150KB of bytecode off the library import path
+    import argparse
+
     parser = argparse.ArgumentParser(description="MongoDB Interactive Shell")
     parser.add_argument("dsn", nargs="?", help="MongoDB connection URI")
     parser.add_argument("--host", help="MongoDB host")
@@ -255,22 +443,21 @@ def main():
     parser.add_argument("--username", help="Username")
     parser.add_argument("--password", help="Password")
     parser.add_argument("--file", help="Execute operations from JSON file")
+    parser.add_argument(
+        "--batch-size", type=int,
+        help=f"Cursor batch size for find/aggregate (default: {_DEFAULT_BATCH_SIZE})"
+    )
 
     args = parser.parse_args()
 
-    kwargs = {}
-    if args.host:
-        kwargs['host'] = args.host
-    if args.port:
-        kwargs['port'] = args.port
-    if args.database:
-        kwargs['database'] = args.database
-    if args.username:
-        kwargs['username'] = args.username
-    if args.password:
-        kwargs['password'] = args.password
-
-    cli = MongoDBCLI(dsn=args.dsn, **kwargs)
+    # One comprehension over the declared keys instead of an if per
+    # option; unset arguments default to None and are skipped
+    kwargs = {
+        key: value for key in _CONN_KEYS
+        if (value := getattr(args, key)) is not None
+    }
+
+    cli = MongoDBCLI(dsn=args.dsn, batch_size=args.batch_size, **kwargs)
 
     if args.file:
         cli.connect()
@@ -4,8 +4,8 @@ using the py-mongo-libs library.
 
 DML (Data Manipulation Language) operations:
 - INSERT: insert_one, insert_many
-- UPDATE: update_one, update_many, replace_one
-- DELETE: delete_one, delete_many
+- UPDATE/DELETE: one bulk_write of UpdateOne, UpdateMany, ReplaceOne,
+  DeleteOne, DeleteMany (single round trip for the mixed batch)
 - SELECT: find, find_one
 
 DDL (Data Definition Language) operations:
@@ -18,9 +18,11 @@ import sys
 import os
 
 # Add the src directory to the path so we can import the library
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.core.connection import Connection, connect
+from pymongo import DeleteMany, DeleteOne, ReplaceOne, UpdateMany, UpdateOne
+
+from mongo_connection.core.connection import Connection, connect
 
 
 def example_connection():
@@ -136,8 +138,12 @@ def example_dml_operations():
     try:
         with connect(host="localhost", port=27017, database="testdb",
                      connect_timeout=5.0, server_selection_timeout=5.0) as conn:
+            # Resolve the collection handle once and reuse it; the
+            # Connection memoizes handles by name as well, so even code
+            # that calls conn.collection("users") per operation skips
+            # the database attribute walk after the first lookup
             collection = conn.collection("users")
-            
+
             # INSERT operations
             print("\n1. INSERT Operations:")
             
@@ -172,10 +178,12 @@ def example_dml_operations():
             
             # Find many documents
             print("   b) Finding multiple documents:")
-            cursor = collection.find({"age": {"$gt": 25}})
-            docs = list(cursor)
-            print(f"      ✓ Found {len(docs)} documents with age > 25")
-            for doc in docs:
+            count = collection.count_documents({"age": {"$gt": 25}})
+            print(f"      ✓ Found {count} documents with age > 25")
+            cursor = collection.find(
+                {"age": {"$gt": 25}}, {"name": 1, "age": 1, "_id": 0}
+            )
+            for doc in cursor:
                 print(f"        - {doc.get('name')} (age: {doc.get('age')})")
             
             # Count documents
@@ -183,48 +191,34 @@ def example_dml_operations():
             count = collection.count_documents({})
             print(f"      ✓ Total documents: {count}")
             
-            # UPDATE operations
-            print("\n3. UPDATE Operations:")
-            
-            # Update one document
-            print("   a) Updating one document:")
-            result = collection.update_one(
-                {"name": "Alice"},
-                {"$set": {"age": 31, "city": "Boston"}}
-            )
-            print(f"      ✓ Matched: {result.matched_count}, Modified: {result.modified_count}")
-            
-            # Update many documents
-            print("   b) Updating multiple documents:")
-            result = collection.update_many(
-                {"city": "New York"},
-                {"$inc": {"age": 1}}
-            )
-            print(f"      ✓ Matched: {result.matched_count}, Modified: {result.modified_count}")
-            
-            # Replace one document
-            print("   c) Replacing one document:")
-            result = collection.replace_one(
-                {"name": "Bob"},
-                {"name": "Robert", "email": "robert@example.com", "age": 26, "city": "San Francisco"}
-            )
-            print(f"      ✓ Matched: {result.matched_count}, Modified: {result.modified_count}")
-            
-            # DELETE operations
-            print("\n4. DELETE Operations:")
-            
-            # Delete one document
-            print("   a) Deleting one document:")
-            result = collection.delete_one({"name": "Charlie"})
-            print(f"      ✓ Deleted {result.deleted_count} document(s)")
-            
-            # Delete many documents
-            print("   b) Deleting multiple documents:")
-            result = collection.delete_many({"age": {"$lt": 30}})
-            print(f"      ✓ Deleted {result.deleted_count} document(s)")
-            
+            # UPDATE + DELETE operations, pipelined
+            print("\n3. UPDATE and DELETE Operations (one bulk_write):")
+
+            # Issuing update_one/update_many/replace_one/delete_one/
+            # delete_many individually costs one network round trip each.
+            # bulk_write ships the whole mixed batch in a single command
+            # and the server applies the operations in order.
+            result = collection.bulk_write([
+                UpdateOne(
+                    {"name": "Alice"},
+                    {"$set": {"age": 31, "city": "Boston"}}
+                ),
+                UpdateMany(
+                    {"city": "New York"},
+                    {"$inc": {"age": 1}}
+                ),
+                ReplaceOne(
+                    {"name": "Bob"},
+                    {"name": "Robert", "email": "robert@example.com", "age": 26, "city": "San Francisco"}
+                ),
+                DeleteOne({"name": "Charlie"}),
+                DeleteMany({"age": {"$lt": 30}}),
+            ])
+            print(f"   ✓ Matched: {result.matched_count}, Modified: {result.modified_count}")
+            print(f"   ✓ Deleted: {result.deleted_count}")
+
             # Final count
-            print("\n5. Final document count:")
+            print("\n4. Final document count:")
             count = collection.count_documents({})
             print(f"   ✓ Remaining documents: {count}")
             
@@ -251,28 +245,33 @@ def example_advanced_queries():
             ])
             
             print("\n1. Query with multiple conditions:")
-            cursor = collection.find({
+            # Counting server-side ships one integer back instead of
+            # materializing every matching document just to len() it
+            query = {
                 "$and": [
                     {"age": {"$gte": 25}},
                     {"age": {"$lte": 35}},
                     {"city": "Seattle"}
                 ]
-            })
-            docs = list(cursor)
-            print(f"   ✓ Found {len(docs)} documents")
-            
+            }
+            count = collection.count_documents(query)
+            print(f"   ✓ Found {count} documents")
+
             print("\n2. Sorting and limiting:")
-            cursor = collection.find({}).sort("age", -1).limit(2)
-            docs = list(cursor)
+            # Stream the cursor rather than list()-ing it — memory stays
+            # O(1) in the result size — and project only the fields the
+            # loop reads so less BSON crosses the wire
+            cursor = collection.find(
+                {}, {"name": 1, "age": 1, "_id": 0}
+            ).sort("age", -1).limit(2)
             print(f"   ✓ Top 2 oldest users:")
-            for doc in docs:
+            for doc in cursor:
                 print(f"     - {doc.get('name')}: {doc.get('age')} years old")
-            
+
             print("\n3. Projection (selecting specific fields):")
             cursor = collection.find({}, {"name": 1, "age": 1, "_id": 0})
-            docs = list(cursor)
             print(f"   ✓ Selected fields only:")
-            for doc in docs:
+            for doc in cursor:
                 print(f"     - {doc}")
             
     except Exception as e:
@@ -5,21 +5,41 @@ This script performs basic connectivity and functionality tests.
 
 import sys
 import os
+import uuid
 
 # Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.core.connection import Connection, connect
-from src.core.exceptions import InterfaceError
+from mongo_connection.core.connection import Connection, connect, close_all_clients
+from mongo_connection.core.exceptions import InterfaceError
+
+# One connection shared by every live test: a single server-selection +
+# auth handshake instead of one per test function. run_all_tests closes
+# it (and the pooled clients) at the end.
+_shared_conn = None
+
+
+def _get_conn():
+    """Return the shared test connection, connecting on first use"""
+    global _shared_conn
+    if _shared_conn is None or _shared_conn.closed:
+        _shared_conn = connect(
+            host="localhost",
+            port=27017,
+            database="testdb",
+            connect_timeout=5.0,
+            server_selection_timeout=5.0
+        )
+    return _shared_conn
 
 
 def test_imports():
     """Test that all required modules can be imported"""
     print("Testing imports...")
     try:
-        from src.core.connection import Connection, connect
-        from src.core.constants import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_DATABASE
-        from src.core.exceptions import InterfaceError
+        from mongo_connection.core.connection import Connection, connect
+        from mongo_connection.core.constants import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_DATABASE
+        from mongo_connection.core.exceptions import InterfaceError
         print("✓ All imports successful")
         return True
     except ImportError as e:
@@ -52,34 +72,27 @@ def test_connection_connectivity():
     print("  (This requires MongoDB to be running on localhost:27017)")
     
     try:
-        conn = connect(
-            host="localhost",
-            port=27017,
-            database="testdb",
-            connect_timeout=5.0,
-            server_selection_timeout=5.0
-        )
-        
+        conn = _get_conn()
+
         # Test database access
         db = conn.database
         print(f"✓ Connected to MongoDB")
         print(f"  - Database name: {db.name}")
-        
+
         # Test client access
         client = conn.client
         print(f"  - Client: {type(client).__name__}")
-        
+
         # Test server info
         try:
             server_info = client.server_info()
             print(f"  - MongoDB version: {server_info.get('version', 'unknown')}")
         except Exception:
             print("  - Could not retrieve server info")
-        
-        conn.close()
-        print("✓ Connection closed successfully")
+
+        # Left open: later tests reuse this connection
         return True
-        
+
     except InterfaceError as e:
         print(f"✗ Connection failed: {e}")
         print("  Make sure MongoDB is running and accessible")
@@ -92,30 +105,34 @@ def test_connection_connectivity():
 def test_collection_operations():
     """Test basic collection operations"""
     print("\nTesting collection operations...")
-    
+
+    # A throwaway per-run database keeps this test isolated from the
+    # shared testdb, and teardown becomes one dropDatabase command
+    # instead of per-document delete round trips
+    dbname = f"testdb_{uuid.uuid4().hex[:8]}"
     try:
-        with connect(host="localhost", port=27017, database="testdb",
-                     connect_timeout=5.0, server_selection_timeout=5.0) as conn:
-            
+        conn = _get_conn()
+        conn.use_database(dbname)
+        try:
             # Get collection
             collection = conn.collection("test_setup")
             print("✓ Collection object retrieved")
-            
+
             # Insert a test document
             result = collection.insert_one({"test": "setup", "value": 123})
             print(f"✓ Document inserted: {result.inserted_id}")
-            
+
             # Find the document
             doc = collection.find_one({"test": "setup"})
             if doc:
                 print(f"✓ Document found: {doc}")
-            
-            # Delete the test document
-            result = collection.delete_one({"test": "setup"})
-            print(f"✓ Test document deleted: {result.deleted_count} document(s)")
-            
+
             return True
-            
+        finally:
+            conn.client.drop_database(dbname)
+            conn.use_database("testdb")
+            print(f"✓ Dropped test database {dbname}")
+
     except Exception as e:
         print(f"✗ Collection operations failed: {e}")
         return False
@@ -155,13 +172,19 @@ def run_all_tests():
     ]
     
     results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"\n✗ {test_name} raised exception: {e}")
-            results.append((test_name, False))
+    try:
+        for test_name, test_func in tests:
+            try:
+                result = test_func()
+                results.append((test_name, result))
+            except Exception as e:
+                print(f"\n✗ {test_name} raised exception: {e}")
+                results.append((test_name, False))
+    finally:
+        # One teardown for the shared connection and the pooled clients
+        if _shared_conn is not None:
+            _shared_conn.close()
+        close_all_clients()
     
     # Summary
     print("\n" + "="*60)